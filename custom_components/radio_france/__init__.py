@@ -1,61 +1,159 @@
+import asyncio
+import math
 import os
+import random
 import re
-import json
-import urllib.parse
 import logging
+import time
 from datetime import timedelta, datetime, tzinfo
-from zoneinfo import ZoneInfo
-from typing import Any, Dict, Optional, Tuple
-from dateutil import tz
-from itertools import dropwhile, takewhile
+from typing import Optional
 
 
-from homeassistant.const import Platform, STATE_ON
+from homeassistant.const import Platform, UnitOfInformation, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.typing import ConfigType
+from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.entity import EntityCategory
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
     UpdateFailed,
 )
-from homeassistant.helpers.debounce import Debouncer
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.components.sensor import RestoreSensor, SensorEntity
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.util import dt as dt_util
 from .const import (
     DOMAIN,
     NAME,
     CONF_RADIO_STATION,
+    CONF_RADIO_STATIONS,
     CONF_API_KEY,
+    CONF_HISTORY_RETENTION_DAYS,
+    DEFAULT_HISTORY_RETENTION_DAYS,
+    GRID_RETENTION,
+    GRID_LOOKAHEAD,
+    GRID_FETCH_OVERLAP,
+    GRID_FULL_REFRESH_INTERVAL,
+    GRID_STALE_KIND,
+    GRID_LOW_WATERMARK,
+    REFRESH_MIN_INTERVAL,
+    REFRESH_MAX_INTERVAL,
+    REFRESH_SETTLE_DELAY,
+    REFRESH_BACKOFF_BASE,
+    REFRESH_BACKOFF_MAX,
+    STORAGE_VERSION,
+    STORAGE_SAVE_DELAY,
+    STARTUP_REFRESH_STAGGER,
+    REFRESH_SLOT,
     LOW_HEADSUP_STATIONS,
+    LIVE_WINDOW,
+    LIVE_SETTLE_DELAY,
+    LIVE_RETRY_DELAYS,
+    LIVE_IDLE_INTERVAL,
+    LIVE_GRID_REFRESH_INTERVAL,
 )
-from .api import RadioFranceApi, RadioFranceApiError
+from .api import RadioFranceApi, RadioFranceApiError, RadioFranceApiRateLimited
+from .timeline import Timeline, TimelineDelta
+from .steps import Step, DiffusionStep, TrackStep, BlankStep
+from .event_store import EventStore
+from .history import HistoryStore, async_remove_history
+from .metrics import Metric, Metrics
 
 
 _LOGGER = logging.getLogger(__name__)
 
+PLATFORMS = [Platform.SENSOR, Platform.CALENDAR]
+
 
 async def async_migrate_entry(hass, config_entry: ConfigEntry):
+    if config_entry.version == 1:
+        # entries used to target a single station
+        data = dict(config_entry.data)
+        data[CONF_RADIO_STATIONS] = [data.pop(CONF_RADIO_STATION)]
+        hass.config_entries.async_update_entry(config_entry, data=data, version=2)
+        _LOGGER.debug(f"Migrated entry {config_entry.entry_id} to version 2")
     return True
 
 
+def entry_stations(entry: ConfigEntry) -> list[str]:
+    """Return the stations followed by an entry, as chosen in the options if changed there"""
+    if entry.version == 1:
+        # not migrated yet, e.g. an entry disabled since before the migration
+        return [entry.data[CONF_RADIO_STATION]]
+    return entry.options.get(CONF_RADIO_STATIONS, entry.data[CONF_RADIO_STATIONS])
+
+
+def entry_retention_days(entry: ConfigEntry) -> int:
+    return entry.options.get(
+        CONF_HISTORY_RETENTION_DAYS, DEFAULT_HISTORY_RETENTION_DAYS
+    )
+
+
+def grid_store_key(station_code: str) -> str:
+    return f"{DOMAIN}.grid.{station_code}"
+
+
+def station_added_signal(entry: ConfigEntry) -> str:
+    """Signal sent with the coordinator of a station added to the entry, for platforms"""
+    return f"{DOMAIN}_{entry.entry_id}_station_added"
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
 
-    # here we store the coordinator for future access
-    if entry.entry_id not in hass.data[DOMAIN]:
-        hass.data[DOMAIN][entry.entry_id] = {}
-    hass.data[DOMAIN][entry.entry_id]["coordinator"] = RadioFranceAPICoordinator(
-        hass, dict(entry.data)
+    # here we store the coordinators of the stations of the entry for future access
+    entry_data = hass.data[DOMAIN][entry.entry_id] = {
+        "stations": {},
+        "history_retention_days": entry_retention_days(entry),
+    }
+    setup_started = time.monotonic()
+    stations = entry_stations(entry)
+    # grids of all stations are fetched by a single batched request if needed
+    results = await asyncio.gather(
+        *(acquire_coordinator(hass, entry, station) for station in stations),
+        return_exceptions=True,
     )
+    for station, result in zip(stations, results):
+        if isinstance(result, BaseException):
+            _LOGGER.error(
+                f"Unable to set {station} up, reload the entry to retry: {result}"
+            )
+            await release_coordinator(hass, entry, station)
+            continue
+        # a station whose first refresh failed is set up anyway, its entities stay
+        # unavailable until one of the following refreshes succeeds
+        entry_data["stations"][station] = result
+    if not any(c.last_update_success for c in entry_data["stations"].values()):
+        # most likely the api cannot be reached at all, HA will retry setup later
+        for station in entry_data["stations"]:
+            await release_coordinator(hass, entry, station)
+        raise ConfigEntryNotReady(f"Unable to fetch the grid of {', '.join(stations)}")
+    coordinators_ready = time.monotonic()
 
     # will make sure async_setup_entry from sensor.py is called
-    await hass.config_entries.async_forward_entry_setups(
-        entry, [Platform.SENSOR, Platform.CALENDAR]
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    # contribution of this entry to startup time, see also tools/import_time.py
+    timing = {
+        "coordinators": round(coordinators_ready - setup_started, 3),
+        "platforms": round(time.monotonic() - coordinators_ready, 3),
+    }
+    entry_data["setup_timing"] = timing
+    _LOGGER.debug(
+        f"Set up {len(stations)} stations of {entry.title} in {sum(timing.values()):.3f}s "
+        f"(grids restored or fetched in {timing['coordinators']:.3f}s, "
+        f"platforms in {timing['platforms']:.3f}s)"
     )
 
     # subscribe to config updates
@@ -67,164 +165,651 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def update_entry(hass, entry):
     """
     This method is called when options are updated
-    We trigger the reloading of entry (that will eventually call async_unload_entry)
+    Stations added or removed are set up or torn down on their own, other changes
+    trigger the reloading of entry (that will eventually call async_unload_entry)
     """
     _LOGGER.debug("update_entry method called")
-    # will make sure async_setup_entry from sensor.py is called
-    await hass.config_entries.async_reload(entry.entry_id)
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    if entry_retention_days(entry) != entry_data["history_retention_days"]:
+        # will make sure async_setup_entry from sensor.py is called
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    wanted = entry_stations(entry)
+    for station in [s for s in entry_data["stations"] if s not in wanted]:
+        await async_remove_station(hass, entry, station)
+    added = [s for s in wanted if s not in entry_data["stations"]]
+    await asyncio.gather(*(async_add_station(hass, entry, s) for s in added))
+
+
+async def async_add_station(
+    hass: HomeAssistant, entry: ConfigEntry, station_code: str
+) -> None:
+    """Start following a station added to an entry which is already set up"""
+    try:
+        coordinator = await acquire_coordinator(hass, entry, station_code)
+    except Exception as e:
+        await release_coordinator(hass, entry, station_code)
+        _LOGGER.error(f"Unable to add {station_code}, reload the entry to retry: {e}")
+        return
+    if not coordinator.last_update_success:
+        # like at setup, refreshes are retried once the entities are added
+        _LOGGER.warning(
+            f"Unable to fetch {station_code} grid, its entities stay unavailable "
+            f"until a refresh succeeds: {coordinator.last_exception}"
+        )
+    hass.data[DOMAIN][entry.entry_id]["stations"][station_code] = coordinator
+    async_dispatcher_send(hass, station_added_signal(entry), coordinator)
+
+
+async def async_remove_station(
+    hass: HomeAssistant, entry: ConfigEntry, station_code: str
+) -> None:
+    """Remove the entities and device of a station removed from an entry"""
+    hass.data[DOMAIN][entry.entry_id]["stations"].pop(station_code)
+    device_registry = dr.async_get(hass)
+    entity_registry = er.async_get(hass)
+    device = device_registry.async_get_device(identifiers={(DOMAIN, station_code)})
+    if device is not None:
+        for entity in er.async_entries_for_device(
+            entity_registry, device.id, include_disabled_entities=True
+        ):
+            if entity.config_entry_id == entry.entry_id:
+                # also removes the entity from hass
+                entity_registry.async_remove(entity.entity_id)
+        # the device is kept as long as another entry follows the station
+        device_registry.async_update_device(
+            device.id, remove_config_entry_id=entry.entry_id
+        )
+    await release_coordinator(hass, entry, station_code)
+    await async_remove_station_data(hass, entry, station_code)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """This method is called to clean all sensors before re-adding them"""
     _LOGGER.debug("async_unload_entry method called")
-    unload_ok = await hass.config_entries.async_unload_platforms(
-        entry, [Platform.SENSOR]
-    )
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        for station in entry_data["stations"]:
+            await release_coordinator(hass, entry, station)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored grids and history of the stations of a removed entry"""
+    for station in entry_stations(entry):
+        await async_remove_station_data(hass, entry, station)
+
+
+async def async_remove_station_data(
+    hass: HomeAssistant, entry: ConfigEntry, station_code: str
+) -> None:
+    """Delete the stored grid and history of a station, unless another entry follows it
+
+    Only called when a station is removed from an entry or the entry is removed: the
+    data is kept when entries are merely unloaded (reload, restart).
+    """
+    for other in hass.config_entries.async_entries(DOMAIN):
+        if other.entry_id != entry.entry_id and station_code in entry_stations(other):
+            return
+    _LOGGER.debug(f"Removing stored grid and history of {station_code}")
+    await Store(hass, STORAGE_VERSION, grid_store_key(station_code)).async_remove()
+    await async_remove_history(hass, station_code)
+
+
+async def acquire_coordinator(
+    hass: HomeAssistant, entry: ConfigEntry, station_code: str
+) -> "RadioFranceAPICoordinator":
+    """Return the coordinator shared by all entries following the same station
+
+    The coordinator is created (using the token of the first entry) when the first
+    entry following the station is set up. Its stored grid is restored and, only if
+    that grid does not cover the current time, a first refresh is done before
+    platforms are set up.
+    The coordinator does not belong to the entry creating it: it is only shut down by
+    release_coordinator, once no entry follows the station anymore, and switches to the
+    token of another entry if the one whose token it uses stops following the station.
+    """
+    coordinators = hass.data[DOMAIN].setdefault("coordinators", {})
+    if station_code not in coordinators:
+        api = acquire_api(hass, entry.data[CONF_API_KEY], station_code)
+        # a coordinator created in the context of an entry setup is shut down when
+        # that entry is unloaded, even if other entries still use it
+        token = config_entries.current_entry.set(None)
+        try:
+            coordinator = RadioFranceAPICoordinator(
+                hass,
+                {**entry.data, **entry.options, CONF_RADIO_STATION: station_code},
+                api,
+            )
+            coordinators[station_code] = {
+                "coordinator": coordinator,
+                "ready": hass.async_create_task(coordinator.async_prepare()),
+                "entries": set(),
+                # entry whose token the coordinator uses
+                "token_entry": entry.entry_id,
+            }
+        finally:
+            config_entries.current_entry.reset(token)
+    shared = coordinators[station_code]
+    shared["entries"].add(entry.entry_id)
+    update_history_retention(hass, station_code)
+    # entries set up concurrently all wait for the preparation started by the first one
+    await shared["ready"]
+    return shared["coordinator"]
+
+
+async def release_coordinator(
+    hass: HomeAssistant, entry: ConfigEntry, station_code: str
+) -> None:
+    """Shut the coordinator of a station down once no entry follows it anymore"""
+    coordinators = hass.data[DOMAIN].get("coordinators", {})
+    if station_code not in coordinators:
+        return
+    shared = coordinators[station_code]
+    shared["entries"].discard(entry.entry_id)
+    if len(shared["entries"]) > 0:
+        update_history_retention(hass, station_code)
+        if shared["token_entry"] == entry.entry_id:
+            # the token may not be valid anymore (e.g. entry removed after its key
+            # was revoked), switch to the token of an entry still following the station
+            await switch_coordinator_token(hass, shared, next(iter(shared["entries"])))
+    else:
+        _LOGGER.debug(f"Shutting {station_code} coordinator down, no entry uses it")
+        # popped first so that an entry set up meanwhile gets a new coordinator
+        coordinator = coordinators.pop(station_code)["coordinator"]
+        await coordinator.async_shutdown()
+        await release_api(hass, coordinator.api_token, station_code)
+
+
+async def switch_coordinator_token(
+    hass: HomeAssistant, shared: dict, entry_id: str
+) -> None:
+    """Make a shared coordinator use the token (and api client) of the given entry"""
+    coordinator = shared["coordinator"]
+    shared["token_entry"] = entry_id
+    token = hass.config_entries.async_get_entry(entry_id).data[CONF_API_KEY]
+    if token == coordinator.api_token:
+        return
+    _LOGGER.debug(f"{coordinator.station_code} coordinator now uses another api token")
+    old_token = coordinator.api_token
+    coordinator.api = acquire_api(hass, token, coordinator.station_code)
+    coordinator.api_token = token
+    await release_api(hass, old_token, coordinator.station_code)
+
+
+def update_history_retention(hass: HomeAssistant, station_code: str) -> None:
+    """Keep the shared history of a station as long as the entries following it want
+
+    Called whenever an entry starts or stops following the station, which includes
+    the reload of an entry whose retention was changed.
+    """
+    shared = hass.data[DOMAIN]["coordinators"][station_code]
+    shared["coordinator"].history.set_retention_days(
+        max(
+            entry_retention_days(hass.config_entries.async_get_entry(entry_id))
+            for entry_id in shared["entries"]
+        )
+    )
+
+
+def acquire_api(hass: HomeAssistant, token: str, user: str) -> RadioFranceApi:
+    """Return the api client shared by all users (stations) of the same token"""
+    apis = hass.data[DOMAIN].setdefault("apis", {})
+    if token not in apis:
+        apis[token] = {"api": RadioFranceApi(token), "users": set()}
+    apis[token]["users"].add(user)
+    return apis[token]["api"]
+
+
+async def release_api(hass: HomeAssistant, token: str, user: str) -> None:
+    """Close the api client once its last user is released"""
+    apis = hass.data[DOMAIN].get("apis", {})
+    if token not in apis:
+        return
+    apis[token]["users"].discard(user)
+    if len(apis[token]["users"]) == 0:
+        _LOGGER.debug("Closing api client, no station is using it anymore")
+        await apis.pop(token)["api"].close()
+
+
+def station_device_info(station_code: str) -> DeviceInfo:
+    """Return the device grouping the entities of a station, whatever the entry"""
+    return DeviceInfo(
+        name=f"{NAME} {station_code}",
+        entry_type=DeviceEntryType.SERVICE,
+        identifiers={(DOMAIN, station_code)},
+        manufacturer=NAME,
+    )
+
+
 class RadioFranceAPICoordinator(DataUpdateCoordinator):
     """A coordinator to fetch data from the api only once"""
 
-    def __init__(self, hass, config: ConfigType):
+    def __init__(self, hass, config: ConfigType, api: RadioFranceApi):
         self.station_code = config[CONF_RADIO_STATION]
         self.logger = logging.getLogger(f"{__name__}.{self.station_code}.coordinator")
 
-        update_interval = timedelta(minutes=60)
-        for station_matcher in LOW_HEADSUP_STATIONS:
-            if re.search(station_matcher, self.station_code):
-                self.logger.warn(
-                    "Data will be refreshed every two minutes because station does not publish program in advance"
-                )
-                update_interval = timedelta(minutes=2)
-
         super().__init__(
             hass,
             self.logger,
             name="radio france api",  # for logging purpose
-            update_interval=update_interval,
+            # adapted after each refresh depending on how far ahead the grid goes
+            update_interval=timedelta(seconds=REFRESH_MIN_INTERVAL),
             update_method=self.update_method,
+            # listeners are only notified when the grid actually changed
+            always_update=False,
         )
         self.config = config
         self.hass = hass
+        self.api = api
         self.api_token = config[CONF_API_KEY]
+        self._last_full_fetch: Optional[int] = None
+        self.last_refresh_at: Optional[datetime] = None
+        self._failed_refreshes = 0
+        # seconds to wait after the api quota was hit
+        self._rate_limited_for: Optional[float] = None
+        self.metrics = Metrics()
+        # stations publishing tracks as they air are followed by live queries
+        self.live = any(re.match(p, self.station_code) for p in LOW_HEADSUP_STATIONS)
+        self._unsub_live_check = None
+        self._live_retries = 0
+        self._live_stopped = False
+        # what the last successful refresh changed in the grid
+        self.last_delta = TimelineDelta(set(), set(), set())
+        self._store = Store(hass, STORAGE_VERSION, grid_store_key(self.station_code))
+        self.history = HistoryStore(
+            hass,
+            self.station_code,
+            config.get(CONF_HISTORY_RETENTION_DAYS, DEFAULT_HISTORY_RETENTION_DAYS),
+        )
 
-    async def update_method(self):
-        """Fetch data from API endpoint."""
-        try:
+    async def async_prepare(self) -> None:
+        """Get the data needed by entities: restored from disk if still valid, fetched otherwise
+
+        Concurrent first refreshes of several stations are sent as a single batched
+        request by the api client.
+        """
+        await self.async_restore()
+        if self.covers_now():
             self.logger.debug(
-                f"Calling update method, {len(self._listeners)} listeners subscribed"
+                f"Restored grid is still valid, next refresh in {self.update_interval}"
             )
-            if "RADIOFRANCE_APIFAIL" in os.environ:
-                raise UpdateFailed(
-                    "Failing update on purpose to test state restoration"
-                )
-            self.logger.debug("Starting collecting data")
-
-            api = RadioFranceApi(self.api_token)
-            try:
-                data = await api.get_programs(self.station_code)
-            except RadioFranceApiError as e:
-                raise UpdateFailed(
-                    f"Failed fetching data from radio france api: {e.text}"
+        else:
+            # the coordinator has no config entry, see acquire_coordinator. On failure
+            # refreshes are retried once entities listen to the coordinator
+            await self.async_refresh()
+        if self.live:
+            self._schedule_live_check()
+
+    async def async_shutdown(self) -> None:
+        self._live_stopped = True
+        if self._unsub_live_check is not None:
+            self._unsub_live_check()
+            self._unsub_live_check = None
+        await super().async_shutdown()
+        if self.data is not None:
+            # rather than leaving a delayed save pending, which would write the grid
+            # back after the storage of a removed station was deleted
+            await self._store.async_save(self._data_to_store())
+
+    @callback
+    def _schedule_live_check(self, min_delay: float = 0) -> None:
+        """Arm the next live query: when the last known track ends, or a bit later"""
+        now = int(datetime.now().timestamp())
+        track_end = 0 if self.data is None else self.data.last_ends().get("track", 0)
+        if min_delay > 0:
+            # live queries are out of quota, the regular refresh catches up meanwhile
+            delay = min_delay
+        elif track_end > now:
+            self._live_retries = 0
+            delay = track_end - now + LIVE_SETTLE_DELAY
+        elif self._live_retries < len(LIVE_RETRY_DELAYS):
+            # next track is not published yet
+            delay = LIVE_RETRY_DELAYS[self._live_retries]
+            self._live_retries += 1
+        else:
+            delay = LIVE_IDLE_INTERVAL
+        self.logger.debug("Next live query in %ds", delay)
+        self._unsub_live_check = async_track_point_in_time(
+            self.hass,
+            self._handle_live_check,
+            dt_util.utcnow() + timedelta(seconds=delay),
+        )
+
+    @callback
+    def _handle_live_check(self, _now: datetime) -> None:
+        self._unsub_live_check = None
+        self.hass.async_create_background_task(
+            self._async_live_check(), f"{DOMAIN} live query {self.station_code}"
+        )
+
+    async def _async_live_check(self) -> None:
+        """Merge the tracks airing around now into the grid, outside of regular refreshes"""
+        now = int(datetime.now().timestamp())
+        retry_after = 0
+        try:
+            with self.metrics.timer("live_fetch"):
+                tracks = await self.api.get_live_tracks(
+                    self.station_code, now - LIVE_WINDOW, now + LIVE_WINDOW
                 )
+        except RadioFranceApiRateLimited as e:
+            self.logger.debug("Live query skipped: %s", e)
+            retry_after = e.retry_after
+            tracks = []
+        except Exception as e:
+            # the next regular refresh will catch up
+            self.logger.debug("Live query failed: %s", e)
+            tracks = []
+        if self.data is not None and len(tracks) > 0:
+            # the live query only returns tracks, other steps are left untouched
+            timeline = self.data.merge(
+                tracks,
+                now - LIVE_WINDOW,
+                now + LIVE_WINDOW,
+                now - GRID_RETENTION,
+                kinds=("track",),
+            )
+            delta = timeline.diff(self.data)
+            self.logger.debug("Live query: %s", delta)
+            if delta:
+                # data, delta and listeners are updated without yielding to a refresh
+                # finishing meanwhile, which would notify listeners with its own delta
+                self.data = timeline
+                self.last_delta = delta
+                # unlike async_set_updated_data, the regular refresh is not postponed
+                self.async_update_listeners()
+                self._persist(timeline, delta)
+        if not self._live_stopped:
+            self._schedule_live_check(retry_after)
+
+    async def async_restore(self) -> None:
+        """Load the last grid saved to disk, if any"""
+        stored = await self._store.async_load()
+        if stored is None:
+            return
+        self.data = Timeline.from_grid(stored["steps"])
+        self.last_delta = self.data.diff(None)
+        self._last_full_fetch = stored["last_full_fetch"]
+        # stagger the deferred refreshes of all stations restored at startup
+        self.update_interval = self._on_refresh_slot(
+            self._next_refresh_interval(self.data)
+            + timedelta(seconds=random.uniform(0, STARTUP_REFRESH_STAGGER))
+        )
+        self.logger.debug(
+            f"Restored {len(self.data)} steps fetched at {stored['fetched_at']}"
+        )
+
+    def covers_now(self) -> bool:
+        """Return True if the known grid is still usable to tell what airs now"""
+        if self.data is None:
+            return False
+        now = int(datetime.now().timestamp())
+        return self.data.first_start <= now < self.data.frontier(now - GRID_STALE_KIND)
+
+    def _next_refresh_interval(self, timeline: Timeline) -> timedelta:
+        """Compute when to refresh next, depending on how far ahead the grid is known"""
+        now = int(datetime.now().timestamp())
+        frontier = timeline.frontier(now - GRID_STALE_KIND)
+        if frontier - now > GRID_LOW_WATERMARK:
+            # enough is known, refresh once coverage drops below the watermark
+            delay = frontier - now - GRID_LOW_WATERMARK
+        else:
+            # station publishes little in advance, refresh as soon as the last known step is over
+            delay = frontier - now + REFRESH_SETTLE_DELAY
+        if self.live:
+            # tracks airing now are fetched by live queries
+            delay = max(delay, LIVE_GRID_REFRESH_INTERVAL)
+        delay = min(max(delay, REFRESH_MIN_INTERVAL), REFRESH_MAX_INTERVAL)
+        return timedelta(seconds=delay)
+
+    def _backoff_interval(self) -> timedelta:
+        """Compute when to retry after consecutive failed refreshes"""
+        delay = min(
+            REFRESH_BACKOFF_BASE * 2 ** (self._failed_refreshes - 1),
+            REFRESH_BACKOFF_MAX,
+        )
+        # jitter avoids all stations retrying at the same time
+        return timedelta(seconds=delay * random.uniform(0.5, 1))
+
+    def _on_refresh_slot(self, interval: timedelta) -> timedelta:
+        """Delay a refresh to the next slot shared by all stations
+
+        Each station computes its own refresh interval, with jitter: without slots their
+        refreshes would hardly ever fall in the same batch window of the api client.
+        Home Assistant schedules refreshes on the whole second of the loop time (plus a
+        fraction of a second of its own), so stations due in the same slot are refreshed
+        within the batch window.
+        """
+        now = int(self.hass.loop.time())
+        due = now + interval.total_seconds()
+        return timedelta(seconds=math.ceil(due / REFRESH_SLOT) * REFRESH_SLOT - now)
+
+    @callback
+    def _data_to_store(self) -> dict:
+        return {
+            "steps": [p.to_dict() for p in self.data.steps],
+            "last_full_fetch": self._last_full_fetch,
+            "fetched_at": int(datetime.now().timestamp()),
+        }
+
+    @callback
+    def async_update_listeners(self) -> None:
+        with self.metrics.timer("listeners"):
+            super().async_update_listeners()
 
-            return data
+    async def update_method(self):
+        """Fetch data from API endpoint and schedule next refresh"""
+        self.last_refresh_at = dt_util.utcnow()
+        try:
+            with self.metrics.timer("refresh"):
+                timeline = await self._fetch_timeline()
         except Exception as err:
+            self._failed_refreshes += 1
+            self.metrics.record("failed_refreshes", self._failed_refreshes)
+            self.update_interval = self._on_refresh_slot(self._backoff_interval())
+            self.logger.debug(
+                "Refresh failed %d times in a row, retrying in %s",
+                self._failed_refreshes,
+                self.update_interval,
+            )
             raise UpdateFailed(f"Error communicating with API: {err}")
+        self._failed_refreshes = 0
+        self.update_interval = self._next_refresh_interval(timeline)
+        if self._rate_limited_for is not None:
+            self.update_interval = max(
+                self.update_interval,
+                timedelta(seconds=self._rate_limited_for * random.uniform(1, 1.5)),
+            )
+            self._rate_limited_for = None
+        self.update_interval = self._on_refresh_slot(self.update_interval)
+        self.logger.debug("Next refresh in %s", self.update_interval)
+        return timeline
 
+    async def _fetch_timeline(self) -> Timeline:
+        self.logger.debug(
+            "Calling update method, %d listeners subscribed", len(self._listeners)
+        )
+        if "RADIOFRANCE_APIFAIL" in os.environ:
+            raise UpdateFailed("Failing update on purpose to test state restoration")
+        self.logger.debug("Starting collecting data")
 
-class AiringNowProgramEntity(CoordinatorEntity, SensorEntity):
-    """Expose the program airing now on the given station"""
+        now = int(datetime.now().timestamp())
+        start_ts = now - GRID_RETENTION
+        end_ts = now + GRID_LOOKAHEAD
+        full_fetch = (
+            self.data is None
+            or self._last_full_fetch is None
+            or now - self._last_full_fetch >= GRID_FULL_REFRESH_INTERVAL
+            # stub grid is static, merging it with itself would evict everything
+            or os.getenv("RADIOFRANCE_STUB")
+        )
+        if not full_fetch:
+            frontier = self.data.frontier(now - GRID_STALE_KIND)
+            start_ts = max(start_ts, min(frontier, end_ts) - GRID_FETCH_OVERLAP)
+        self.logger.debug(
+            "Fetching %s grid from %d to %d",
+            "full" if full_fetch else "incremental",
+            start_ts,
+            end_ts,
+        )
+
+        try:
+            # includes waiting for other stations of the batch and for the rate limit
+            with self.metrics.timer("fetch"):
+                steps = await self.api.get_programs(self.station_code, start_ts, end_ts)
+        except RadioFranceApiRateLimited as e:
+            if self.data is None:
+                raise UpdateFailed(f"Rate limited by radio france api: {e}")
+            # keep serving the grid we have, the scheduler will retry later
+            self.logger.info(
+                f"Rate limited by radio france api, keeping current grid: {e}"
+            )
+            self._rate_limited_for = e.retry_after
+            self.last_delta = TimelineDelta(set(), set(), set())
+            return self.data
+        except RadioFranceApiError as e:
+            raise UpdateFailed(f"Failed fetching data from radio france api: {e}")
+
+        with self.metrics.timer("merge"):
+            if full_fetch:
+                self._last_full_fetch = now
+                timeline = Timeline(steps)
+            else:
+                # the api fetches a window aligned around [start_ts, end_ts], steps
+                # starting in it and not returned were removed from the grid
+                timeline = self.data.merge(
+                    steps, start_ts, end_ts, now - GRID_RETENTION
+                )
+            delta = timeline.diff(self.data)
+        self.metrics.record("steps", len(timeline))
+        self.metrics.record("changed_steps", len(delta.added) + len(delta.changed))
+        self.last_delta = delta
+        self.logger.debug("Grid refreshed: %s", delta)
+        if not delta:
+            # keep the current instance, listeners will not be notified
+            return self.data
+        # not awaited: the timeline must be published (and listeners notified with
+        # its delta) before a live query can change the grid
+        self._persist(timeline, delta)
+        return timeline
+
+    @callback
+    def _persist(self, timeline: Timeline, delta: TimelineDelta) -> None:
+        """Save a changed grid and append its new steps to the history, in the background"""
+        # written later from the executor, several refreshes may be saved at once
+        self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+        self.hass.async_create_background_task(
+            self._async_append_history(timeline, delta),
+            f"{DOMAIN} history {self.station_code}",
+        )
+
+    async def _async_append_history(
+        self, timeline: Timeline, delta: TimelineDelta
+    ) -> None:
+        try:
+            await self.history.async_append(
+                p
+                for p in timeline.steps
+                if p.id in delta.added or p.id in delta.changed
+            )
+        except OSError as e:
+            self.logger.warning(f"Unable to write program history: {e}")
+
+
+class AiringNowEntity(CoordinatorEntity, SensorEntity):
+    """Base class of sensors exposing the step of a given kind airing now
+
+    State is computed when the coordinator publishes new data and when the current
+    step ends, thanks to a single timer armed at the next transition of the grid.
+    """
+
+    _step_kind: str
 
     def __init__(
         self,
         coordinator: RadioFranceAPICoordinator,
         hass: HomeAssistant,
         config_entry: ConfigEntry,
+        name: str,
+        unique_id_suffix: str,
     ):
-        self.logger = logging.getLogger(
-            f"{__name__}.{config_entry.data[CONF_RADIO_STATION]}"
-        )
+        self.logger = logging.getLogger(f"{__name__}.{coordinator.station_code}")
         CoordinatorEntity.__init__(self, coordinator)
         self._coordinator = coordinator
         self.hass = hass
         self.config_entry = config_entry
-        self._attr_name = f"Airing now on {self.config_entry.data[CONF_RADIO_STATION]}"
+        self._attr_name = name
         self._attr_native_value = None
         self._attr_state_attributes = {}
-        self._attr_unique_id = f"sensor.radio_france.{self.config_entry.entry_id}.{self.config_entry.data[CONF_RADIO_STATION]}-airing-now"
+        self._attr_unique_id = f"sensor.radio_france.{self.config_entry.entry_id}.{coordinator.station_code}-{unique_id_suffix}"
+        self._unsub_transition = None
 
-        self._attr_device_info = DeviceInfo(
-            name=f"{NAME} {config_entry.data.get(CONF_RADIO_STATION)}",
-            entry_type=DeviceEntryType.SERVICE,
-            identifiers={
-                (
-                    DOMAIN,
-                    str(config_entry.data.get(CONF_RADIO_STATION)),
-                )
-            },
-            manufacturer=NAME,
-        )
+        self._attr_device_info = station_device_info(coordinator.station_code)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self.coordinator.data is not None:
+            self._refresh_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._cancel_transition()
+        await super().async_will_remove_from_hass()
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self.logger.debug(f"Receiving an update for {self.unique_id} sensor")
+        self.logger.debug("Receiving an update for %s sensor", self.unique_id)
         if not self.coordinator.last_update_success:
             self.logger.debug("Last coordinator failed, assuming state has not changed")
             return
+        self._refresh_state()
 
-    # this method is called every 30 seconds
-    async def async_update(self) -> None:
-        self.logger.debug(f"Starting update of {self._attr_unique_id}")
+    @callback
+    def _handle_transition(self, _now: datetime) -> None:
+        self._unsub_transition = None
+        self._refresh_state()
+
+    @callback
+    def _refresh_state(self) -> None:
+        with self.coordinator.metrics.timer("entity_update"):
+            self._refresh_state_now()
+
+    def _refresh_state_now(self) -> None:
         now = int(datetime.now().timestamp())
-        programs = self.coordinator.data
-        current_program = None
-        for p in programs:
-            if "diffusion" not in p or p["diffusion"] is None:
-                continue
-            if now in range(p["start"], p["end"]):
-                current_program = p
-                break
-        old_value = self._attr_native_value
-        if current_program is None:
-            now_dt = datetime.fromtimestamp(now, self.timezone())
-            first_program_start = datetime.fromtimestamp(
-                programs[0]["start"], self.timezone()
-            )
-            last_program_end = datetime.fromtimestamp(
-                programs[-1]["end"], self.timezone()
+        timeline = self.coordinator.data
+        # attributes are updated in place, compare a copy
+        old_state = (self._attr_native_value, dict(self._attr_state_attributes))
+        self._update_from_step(timeline.current(self._step_kind, now), now)
+        if old_state != (self._attr_native_value, self._attr_state_attributes):
+            self.async_write_ha_state()
+
+        self._cancel_transition()
+        next_transition = timeline.next_transition(now, self._step_kind)
+        if next_transition is not None:
+            self._unsub_transition = async_track_point_in_time(
+                self.hass,
+                self._handle_transition,
+                datetime.fromtimestamp(next_transition, self.timezone()),
             )
-            self._attr_native_value = None
-            self._attr_icon = "mdi:radio-off"
-            self._attr_state_attributes = {}
-            if old_value != self._attr_native_value:
-                self.async_write_ha_state()
-            if now_dt >= last_program_end:
-                # this is the case of FIP and other music-only station. See https://github.com/kamaradclimber/radio-france-home-assistant/issues/1
-                raise Exception(
-                    f"Unable to find currently airing program. Now is {now_dt}. First program starts at {first_program_start}, last program stops at {last_program_end}"
-                )
-            else:
-                return
-        if current_program["diffusion"] is not None:
-            self._attr_icon = "mdi:radio"
-            self._attr_native_value = current_program["diffusion"]["title"]
-            if "standFirst" in current_program["diffusion"]:
-                self._attr_state_attributes["description"] = current_program[
-                    "diffusion"
-                ]["standFirst"]
-            if "url" in current_program["diffusion"]:
-                self._attr_state_attributes["url"] = current_program["diffusion"]["url"]
-        else:
-            self._attr_native_value = "No diffusion"
-            self._attr_icon = "mdi:radio-off"
-            self._attr_state_attributes = current_program
 
-        if old_value != self._attr_native_value:
-            self.async_write_ha_state()
+    def _cancel_transition(self) -> None:
+        if self._unsub_transition is not None:
+            self._unsub_transition()
+            self._unsub_transition = None
+
+    def _update_from_step(self, current_step: Optional[Step], now: int) -> None:
+        raise NotImplementedError()
+
+    def _warn_if_grid_exhausted(self, now: int) -> None:
+        timeline = self.coordinator.data
+        now_dt = datetime.fromtimestamp(now, self.timezone())
+        first_start = datetime.fromtimestamp(timeline.first_start, self.timezone())
+        last_end = datetime.fromtimestamp(timeline.last_end, self.timezone())
+        if now_dt >= last_end:
+            # this is the case of FIP and other music-only station. See https://github.com/kamaradclimber/radio-france-home-assistant/issues/1
+            self.logger.warning(
+                f"Unable to find currently airing {self._step_kind}. Now is {now_dt}. First step starts at {first_start}, last step stops at {last_end}"
+            )
 
     def timezone(self) -> tzinfo:
         return dt_util.get_default_time_zone()
@@ -233,14 +818,11 @@ class AiringNowProgramEntity(CoordinatorEntity, SensorEntity):
     def state_attributes(self):
         return self._attr_state_attributes
 
-    @property
-    def should_poll(self) -> bool:
-        # by default, coordinatorentity are not polled
-        return True
 
+class AiringNowProgramEntity(AiringNowEntity):
+    """Expose the program airing now on the given station"""
 
-class AiringNowTrackEntity(CoordinatorEntity, SensorEntity):
-    """Expose the track airing now on the given station"""
+    _step_kind = "diffusion"
 
     def __init__(
         self,
@@ -248,102 +830,132 @@ class AiringNowTrackEntity(CoordinatorEntity, SensorEntity):
         hass: HomeAssistant,
         config_entry: ConfigEntry,
     ):
-        self.logger = logging.getLogger(
-            f"{__name__}.{config_entry.data[CONF_RADIO_STATION]}"
-        )
-        CoordinatorEntity.__init__(self, coordinator)
-        self._coordinator = coordinator
-        self.hass = hass
-        self.config_entry = config_entry
-        self._attr_name = (
-            f"Current track on {self.config_entry.data[CONF_RADIO_STATION]}"
-        )
-        self._attr_native_value = None
-        self._attr_state_attributes = {}
-        self._attr_unique_id = f"sensor.radio_france.{self.config_entry.entry_id}.{self.config_entry.data[CONF_RADIO_STATION]}-airing-now-track"
-
-        self._attr_device_info = DeviceInfo(
-            name=f"{NAME} {config_entry.data.get(CONF_RADIO_STATION)}",
-            entry_type=DeviceEntryType.SERVICE,
-            identifiers={
-                (
-                    DOMAIN,
-                    str(config_entry.data.get(CONF_RADIO_STATION)),
-                )
-            },
-            manufacturer=NAME,
+        super().__init__(
+            coordinator,
+            hass,
+            config_entry,
+            f"Airing now on {coordinator.station_code}",
+            "airing-now",
         )
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self.logger.debug(f"Receiving an update for {self.unique_id} sensor")
-        if not self.coordinator.last_update_success:
-            self.logger.debug("Last coordinator failed, assuming state has not changed")
+    def _update_from_step(self, current_program: Optional[Step], now: int) -> None:
+        if current_program is None:
+            self._attr_native_value = None
+            self._attr_icon = "mdi:radio-off"
+            self._attr_state_attributes = {}
+            self._warn_if_grid_exhausted(now)
             return
+        self._attr_icon = "mdi:radio"
+        self._attr_native_value = current_program.title
+        self._attr_state_attributes["description"] = current_program.stand_first
+        self._attr_state_attributes["url"] = current_program.url
 
-    # this method is called every 30 seconds
-    async def async_update(self) -> None:
-        self.logger.debug(f"Starting update of {self._attr_unique_id}")
-        now = int(datetime.now().timestamp())
-        programs = self.coordinator.data
-        current_program = None
-        for p in programs:
-            if "track" not in p or p["track"] is None:
-                continue
-            if now in range(p["start"], p["end"]):
-                current_program = p
-                break
-        old_value = self._attr_native_value
+
+class AiringNowTrackEntity(AiringNowEntity):
+    """Expose the track airing now on the given station"""
+
+    _step_kind = "track"
+
+    def __init__(
+        self,
+        coordinator: RadioFranceAPICoordinator,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+    ):
+        super().__init__(
+            coordinator,
+            hass,
+            config_entry,
+            f"Current track on {coordinator.station_code}",
+            "airing-now-track",
+        )
+
+    def _update_from_step(self, current_program: Optional[Step], now: int) -> None:
         if current_program is None:
-            now_dt = datetime.fromtimestamp(now, self.timezone())
-            first_program_start = datetime.fromtimestamp(
-                programs[0]["start"], self.timezone()
-            )
-            last_program_end = datetime.fromtimestamp(
-                programs[-1]["end"], self.timezone()
-            )
             self._attr_native_value = None
             self._attr_icon = "mdi:music-off"
             self._attr_state_attributes = {}
-            if old_value != self._attr_native_value:
-                self.async_write_ha_state()
-            if now_dt >= last_program_end:
-                # this is the case of FIP and other music-only station. See https://github.com/kamaradclimber/radio-france-home-assistant/issues/1
-                raise Exception(
-                    f"Unable to find currently airing track. Now is {now_dt}. First track starts at {first_program_start}, last track stops at {last_program_end}"
-                )
-            else:
-                return
-        if current_program["track"] is not None:
-            self._attr_icon = "mdi:music"
-            self._attr_native_value = current_program["track"]["title"]
-            if "albumTitle" in current_program["track"]:
-                self._attr_state_attributes["description"] = current_program["track"][
-                    "albumTitle"
-                ]
-            if "mainArtists" in current_program["track"]:
-                self._attr_state_attributes["artists"] = ", ".join(
-                    current_program["track"]["mainArtists"]
-                )
-        else:
-            self._attr_native_value = "No music currently played"
-            self._attr_icon = "mdi:music-off"
-            self._attr_state_attributes = current_program
+            self._warn_if_grid_exhausted(now)
+            return
+        self._attr_icon = "mdi:music"
+        self._attr_native_value = current_program.title
+        self._attr_state_attributes["description"] = current_program.album_title
+        self._attr_state_attributes["artists"] = ", ".join(current_program.main_artists)
 
-        if old_value != self._attr_native_value:
-            self.async_write_ha_state()
 
-    def timezone(self) -> tzinfo:
-        return dt_util.get_default_time_zone()
+DURATION_METRIC = (UnitOfTime.MILLISECONDS, SensorDeviceClass.DURATION)
+# key, name, where the metric is recorded, unit, device class
+METRIC_SENSORS = [
+    ("refresh", "refresh duration", "coordinator", *DURATION_METRIC),
+    ("fetch", "fetch latency", "coordinator", *DURATION_METRIC),
+    ("parse_time", "grid parse time", "station", *DURATION_METRIC),
+    ("steps", "grid steps", "coordinator", None, None),
+    ("listeners", "listeners update time", "coordinator", *DURATION_METRIC),
+    ("entity_update", "entity update time", "coordinator", *DURATION_METRIC),
+    ("request_latency", "api request latency", "api", *DURATION_METRIC),
+    (
+        "bytes_received",
+        "api bytes received",
+        "api",
+        UnitOfInformation.BYTES,
+        SensorDeviceClass.DATA_SIZE,
+    ),
+]
+
+
+class RefreshMetricSensor(SensorEntity):
+    """Diagnostic sensor exposing the last value of a refresh metric
+
+    Polled rather than pushed: metrics change on every refresh, even when listeners
+    are not notified because the grid did not change. Disabled by default.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: RadioFranceAPICoordinator,
+        config_entry: ConfigEntry,
+        key: str,
+        name: str,
+        source: str,
+        unit: Optional[str],
+        device_class: Optional[SensorDeviceClass],
+    ):
+        station = coordinator.station_code
+        self.coordinator = coordinator
+        self._key = key
+        self._source = source
+        self._attr_name = f"{station} {name}"
+        self._attr_unique_id = (
+            f"sensor.radio_france.{config_entry.entry_id}.{station}-metric-{key}"
+        )
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = device_class
+        self._attr_device_info = station_device_info(station)
+
+    def _metric(self) -> Optional[Metric]:
+        if self._source == "coordinator":
+            metrics = self.coordinator.metrics
+        elif self._source == "station":
+            metrics = self.coordinator.api.station_metrics.get(
+                self.coordinator.station_code
+            )
+        else:
+            metrics = self.coordinator.api.metrics
+        return None if metrics is None else metrics.get(self._key)
 
     @property
-    def state_attributes(self):
-        return self._attr_state_attributes
+    def native_value(self) -> Optional[float]:
+        metric = self._metric()
+        return None if metric is None else round(metric.last, 3)
 
     @property
-    def should_poll(self) -> bool:
-        # by default, coordinatorentity are not polled
-        return True
+    def extra_state_attributes(self) -> Optional[dict]:
+        metric = self._metric()
+        return None if metric is None else metric.as_dict()
 
 
 class AiringCalendar(CoordinatorEntity, CalendarEntity):
@@ -353,90 +965,113 @@ class AiringCalendar(CoordinatorEntity, CalendarEntity):
         hass: HomeAssistant,
         config_entry: ConfigEntry,
     ):
-        self.logger = logging.getLogger(
-            f"{__name__}.{config_entry.data[CONF_RADIO_STATION]}"
-        )
+        self.logger = logging.getLogger(f"{__name__}.{coordinator.station_code}")
         CoordinatorEntity.__init__(self, coordinator)
         self._coordinator = coordinator
         self.hass = hass
         self.config_entry = config_entry
-        self._attr_name = f"{self.config_entry.data[CONF_RADIO_STATION]} calendar"
-        self._attr_unique_id = f"calendar.radio_france.{self.config_entry.entry_id}.{self.config_entry.data[CONF_RADIO_STATION]}"
-        self._events = []
-
-        self._attr_device_info = DeviceInfo(
-            name=f"{NAME} {config_entry.data.get(CONF_RADIO_STATION)}",
-            entry_type=DeviceEntryType.SERVICE,
-            identifiers={
-                (
-                    DOMAIN,
-                    str(config_entry.data.get(CONF_RADIO_STATION)),
-                )
-            },
-            manufacturer=NAME,
-        )
+        self._attr_name = f"{coordinator.station_code} calendar"
+        self._attr_unique_id = f"calendar.radio_france.{self.config_entry.entry_id}.{coordinator.station_code}"
+        self._events = EventStore(self._event_from_step)
+
+        self._attr_device_info = station_device_info(coordinator.station_code)
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self.logger.debug(f"Receiving an update for {self.unique_id} calendar")
+        self.logger.debug("Receiving an update for %s calendar", self.unique_id)
         if not self.coordinator.last_update_success:
             self.logger.debug("Last coordinator failed, assuming state has not changed")
             return
-        programs = self.coordinator.data
-
-        self._events = []
-        for p in programs:
-            if "track" in p and p["track"] is not None:
-                artists = ", ".join(p["track"]["mainArtists"])
-                self._events.append(
-                    CalendarEvent(
-                        start=datetime.fromtimestamp(p["start"], self.timezone()),
-                        end=datetime.fromtimestamp(p["end"], self.timezone()),
-                        summary=p["track"]["title"],
-                        description=f"by '{artists}' from album '{p['track']['albumTitle']}'",
-                        uid=p["id"],
-                    )
-                )
-            elif "diffusion" in p and p["diffusion"] is not None:
-                self._events.append(
-                    CalendarEvent(
-                        start=datetime.fromtimestamp(p["start"], self.timezone()),
-                        end=datetime.fromtimestamp(p["end"], self.timezone()),
-                        summary=p["diffusion"]["title"],
-                        description=p["diffusion"]["standFirst"],
-                        location=p["diffusion"].get("url", None),
-                        uid=p["id"],
-                    )
-                )
-            elif "title" in p:
-                self._events.append(
-                    CalendarEvent(
-                        start=datetime.fromtimestamp(p["start"], self.timezone()),
-                        end=datetime.fromtimestamp(p["end"], self.timezone()),
-                        summary=p["title"],
-                        uid=p["id"],
-                    )
-                )
-            else:
-                self.logger.warning(f"Event {p} is not handled yet by this integration")
+        with self.coordinator.metrics.timer("entity_update"):
+            self._apply_delta()
+
+    def _apply_delta(self) -> None:
+        delta = self.coordinator.last_delta
+        if delta:
+            changes = self._events.apply(
+                (
+                    p
+                    for p in self.coordinator.data
+                    if p.id in delta.added or p.id in delta.changed
+                ),
+                delta.removed,
+            )
+            self.logger.debug("%d calendar events added, changed or removed", changes)
         self.async_write_ha_state()
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self.coordinator.data is not None:
+            self._build_events()
+
+    def _build_events(self) -> None:
+        changes = self._events.sync(self.coordinator.data)
+        self.logger.debug("%d calendar events added, changed or removed", changes)
+
+    def _event_from_step(self, p: Step) -> Optional[CalendarEvent]:
+        if isinstance(p, TrackStep):
+            artists = ", ".join(p.main_artists)
+            return CalendarEvent(
+                start=datetime.fromtimestamp(p.start, self.timezone()),
+                end=datetime.fromtimestamp(p.end, self.timezone()),
+                summary=p.title,
+                description=f"by '{artists}' from album '{p.album_title}'",
+                uid=p.id,
+            )
+        elif isinstance(p, DiffusionStep):
+            return CalendarEvent(
+                start=datetime.fromtimestamp(p.start, self.timezone()),
+                end=datetime.fromtimestamp(p.end, self.timezone()),
+                summary=p.title,
+                description=p.stand_first,
+                location=p.url,
+                uid=p.id,
+            )
+        elif isinstance(p, BlankStep) and p.title is not None:
+            return CalendarEvent(
+                start=datetime.fromtimestamp(p.start, self.timezone()),
+                end=datetime.fromtimestamp(p.end, self.timezone()),
+                summary=p.title,
+                uid=p.id,
+            )
+        self.logger.warning(f"Event {p} is not handled yet by this integration")
+        return None
+
     def timezone(self) -> tzinfo:
         return dt_util.get_default_time_zone()
 
     async def async_get_events(
         self, hass: HomeAssistant, start_date: datetime, end_date: datetime
     ) -> list[CalendarEvent]:
-        return [e for e in self._events if e.end >= start_date and e.start <= end_date]
+        events = self._events.between(start_date, end_date)
+        timeline = self.coordinator.data
+        window_start = (
+            datetime.fromtimestamp(timeline.first_start, self.timezone())
+            if timeline is not None and len(timeline) > 0
+            else end_date
+        )
+        if start_date < window_start:
+            # older steps are not in the grid anymore, they are served from history
+            known_uids = {e.uid for e in events}
+            steps = await self.coordinator.history.async_read(
+                int(start_date.timestamp()),
+                int(min(end_date, window_start).timestamp()),
+            )
+            for p in steps:
+                if p.id in known_uids:
+                    continue
+                event = self._event_from_step(p)
+                if event is not None:
+                    events.append(event)
+            events.sort(key=lambda e: e.start)
+        return events
 
     @property
     def event(self) -> CalendarEvent | None:
         now = int(datetime.now().timestamp())
         now_dt = datetime.fromtimestamp(now, self.timezone())
-        matching_events = [
-            e for e in self._events if e.start <= now_dt and e.end >= now_dt
-        ]
-        matching_events.sort(key=lambda e: e.end - e.start)
+        # only a handful of events overlap (e.g. a track during a show)
+        matching_events = self._events.at(now_dt)
         if len(matching_events) > 0:
             if len(matching_events) > 1:
                 self.logger.debug(
@@ -1,134 +1,511 @@
+import asyncio
+import functools
 import logging
 from typing import Optional, Tuple
-from homeassistant.helpers.update_coordinator import UpdateFailed
-import re
-from gql import gql, Client
-from gql.transport.aiohttp import AIOHTTPTransport
-from datetime import datetime
+from aiohttp import ClientResponseError
 import os
+import time
 
-from .const import STATIONS_LIST_STUB, GRID_STUB
+from .grid_stream import GridStreamParser
+from .steps import Step, parse_step
+from .metrics import Metrics
+from .scheduler import (
+    RequestScheduler,
+    PRIORITY_BACKGROUND,
+    PRIORITY_LIVE,
+    PRIORITY_USER,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# can be overridden to target a local stand-in server (see tools/)
+API_URL = os.getenv("RADIOFRANCE_API_URL", "https://openapi.radiofrance.fr/v1/graphql")
 
-class RadioFranceApiError(Exception):
-    pass
+# delay during which grid requests are gathered to be sent as a single query
+GRID_BATCH_WINDOW = 0.5
+# grid windows are aligned on this many seconds to share fetches and cached results
+GRID_WINDOW_GRANULARITY = 60
+# how long a fetched grid is reused for identical requests
+GRID_CACHE_TTL = 30
 
+# size of the chunks in which grid responses are read and parsed
+GRID_STREAM_CHUNK_SIZE = 16 * 1024
+# payloads are truncated to this many characters in debug logs
+LOG_PAYLOAD_MAX_LENGTH = 1000
 
-class RadioFranceApi:
-    """Api to get Radio France data"""
+# live queries are skipped if they would wait longer for the rate limit
+LIVE_MAX_WAIT = 30
+# a live station costs one request per track plus retries while the next track is not
+# published, about 400 to 500 requests a day: live queries of all stations of a token
+# may only use this share of its quota, so that grid refreshes always get the rest
+LIVE_QUOTA_SHARE = 0.5
+LIVE_BURST = 5
 
-    def __init__(
-        self,
-        token: str,
-    ) -> None:
-        self._transport = AIOHTTPTransport(
-            url=f"https://openapi.radiofrance.fr/v1/graphql?x-token={token}"
-        )
+# api quota is shared by all requests made with a token: 1000 requests a day,
+# with bursts of up to RATE_LIMIT_BURST requests
+RATE_LIMIT_PER_SECOND = 1000 / 86400
+RATE_LIMIT_BURST = 20
+# background refreshes give up (and keep their data) if they would wait longer
+BACKGROUND_MAX_WAIT = 300
+# used when the api rate limits us without a usable Retry-After header
+DEFAULT_RETRY_AFTER = 60
 
-    async def get_programs(self, station_code: str) -> list:
-        start_ts = int(datetime.now().timestamp()) - 2 * 3600
-        end_ts = int(datetime.now().timestamp() + 6 * 3600)
-        # note: all { are doubled because we format the string
-        programs_query = """
-        query {{
-          grid(
-            start: {start_ts}
-            end: {end_ts}
-            station: {station_code}
-            includeTracks: true
-          ) {{
-            ... on DiffusionStep {{
+# selection of tracks, the only steps requested by live queries
+TRACK_STEP_SELECTION = """
+            ... on TrackStep {
               id
               start
               end
-              diffusion {{
+              track {
                 id
                 title
-                standFirst
-                published_date
-                url
-                }}
-            }}
-            ... on TrackStep {{
+                authors
+                mainArtists
+                albumTitle
+                }
+              }"""
+
+# selection of grid steps, shared by all stations of a batched grid query
+GRID_STEP_SELECTION = (
+    """
+            ... on DiffusionStep {
               id
               start
               end
-              track {{
+              diffusion {
                 id
                 title
-                authors
-                mainArtists
-                albumTitle
-                }}
-              }}
-            ... on BlankStep {{
+                standFirst
+                published_date
+                url
+                }
+            }"""
+    + TRACK_STEP_SELECTION
+    + """
+            ... on BlankStep {
               id
               title
               start
               end
-              }}
-            }}
-          }}
-        """.format(
-            start_ts=start_ts, end_ts=end_ts, station_code=station_code
+              }"""
+)
+
+# other steps (diffusions, blanks) are returned as empty objects
+LIVE_TRACKS_QUERY = f"""
+    query LiveTracks($start_0: Int!, $end_0: Int!, $station_0: StationsEnum!) {{
+      station_0: grid(
+        start: $start_0
+        end: $end_0
+        station: $station_0
+        includeTracks: true
+      ) {{{TRACK_STEP_SELECTION}
+      }}
+    }}"""
+
+# only the fields used to build the station catalogue are requested
+STATIONS_QUERY = """
+    query Stations {
+      brands {
+         id
+         title
+         localRadios {
+           id
+           title
+         }
+         webRadios {
+           id
+           title
+         }
+       }
+    }
+    """
+
+
+@functools.lru_cache(maxsize=None)
+def _import_gql():
+    """Import gql, which takes a while, when the first request is made rather than at startup
+
+    Called from the executor to keep the import off the event loop.
+    """
+    from gql import Client, gql
+    from gql.transport.aiohttp import AIOHTTPTransport
+
+    return Client, gql, AIOHTTPTransport
+
+
+@functools.lru_cache(maxsize=None)
+def grid_query(station_count: int) -> str:
+    """Return the grid query for a batch of station_count stations
+
+    Queries only depend on the batch size: start, end and station of the i-th
+    station are passed as $start_i, $end_i and $station_i variables and its grid is
+    aliased as station_i. Each query is built once and reused afterwards.
+    """
+    variables = ", ".join(
+        f"$start_{i}: Int!, $end_{i}: Int!, $station_{i}: StationsEnum!"
+        for i in range(station_count)
+    )
+    grids = "".join(f"""
+      station_{i}: grid(
+        start: $start_{i}
+        end: $end_{i}
+        station: $station_{i}
+        includeTracks: true
+      ) {{{GRID_STEP_SELECTION}
+      }}""" for i in range(station_count))
+    return f"query Grid({variables}) {{{grids}\n    }}"
+
+
+class _Abbreviated:
+    """Lazily formatted, truncated representation of a value for debug logs"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self) -> str:
+        text = repr(self.value)
+        if len(text) <= LOG_PAYLOAD_MAX_LENGTH:
+            return text
+        return f"{text[:LOG_PAYLOAD_MAX_LENGTH]}... ({len(text)} characters)"
+
+
+class RadioFranceApiError(Exception):
+    pass
+
+
+class RadioFranceApiRateLimited(RadioFranceApiError):
+    """Request was not sent, or refused, because of the api quota"""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RadioFranceApi:
+    """Api to get Radio France data
+
+    A single instance is meant to be shared by all users of a given token: it keeps
+    one connection pool open and fetches the schema only once.
+    Call close() once it is not needed anymore.
+    """
+
+    def __init__(
+        self,
+        token: str,
+    ) -> None:
+        self._url = f"{API_URL}?x-token={token}"
+        self._client = None
+        self._stations_document = None
+        self._session = None
+        self._connect_lock = asyncio.Lock()
+        # station code -> (future, start_ts, end_ts)
+        self._pending_grids: dict[str, Tuple[asyncio.Future, int, int]] = {}
+        self._grid_batch_handle: Optional[asyncio.TimerHandle] = None
+        # (station code, start_ts, end_ts) -> future of the fetch (queued or running)
+        self._inflight_grids: dict[Tuple[str, int, int], asyncio.Future] = {}
+        # (station code, start_ts, end_ts) -> (expiration, grid)
+        self._grid_cache: dict[Tuple[str, int, int], Tuple[float, list[Step]]] = {}
+        self.scheduler = RequestScheduler(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+        # live queries take a token from this budget before queuing in the scheduler
+        self.live_budget = RequestScheduler(
+            RATE_LIMIT_PER_SECOND * LIVE_QUOTA_SHARE, LIVE_BURST
         )
-        _LOGGER.debug(programs_query)
+        # measures of requests made with this token
+        self.metrics = Metrics()
+        # station code -> measures of the grids of this station
+        self.station_metrics: dict[str, Metrics] = {}
+
+    def _handle_rate_limit(self, error: Exception) -> Exception:
+        """Slow all requests down if the api answered 429, return the error to raise"""
+        # gql wraps http errors into a TransportServerError
+        cause = error if isinstance(error, ClientResponseError) else error.__cause__
+        if not isinstance(cause, ClientResponseError) or cause.status != 429:
+            return error
+        retry_after = DEFAULT_RETRY_AFTER
+        headers = cause.headers or {}
+        try:
+            retry_after = int(headers.get("Retry-After", DEFAULT_RETRY_AFTER))
+        except ValueError:
+            # an http date, rare enough to use the default
+            pass
+        _LOGGER.warning(f"Rate limited by the api, pausing requests for {retry_after}s")
+        self.scheduler.penalize(retry_after)
+        return RadioFranceApiRateLimited(str(error), retry_after)
+
+    async def _get_session(self):
+        """Return the long-lived session, connecting (and fetching schema) on first use"""
+        async with self._connect_lock:
+            if self._client is None:
+                Client, gql, AIOHTTPTransport = (
+                    await asyncio.get_running_loop().run_in_executor(None, _import_gql)
+                )
+                self._client = Client(
+                    transport=AIOHTTPTransport(url=self._url),
+                    fetch_schema_from_transport=True,
+                )
+                self._stations_document = gql(STATIONS_QUERY)
+            if self._session is None:
+                # schema is cached on the client so reconnecting after a close will not fetch it again
+                with self.metrics.timer("connect"):
+                    self._session = await self._client.connect_async()
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying connection pool"""
+        if self._grid_batch_handle is not None:
+            self._grid_batch_handle.cancel()
+            self._grid_batch_handle = None
+        for future, _, _ in self._pending_grids.values():
+            future.cancel()
+        self._pending_grids = {}
+        async with self._connect_lock:
+            if self._session is not None:
+                await self._client.close_async()
+                self._session = None
+
+    async def get_programs(
+        self, station_code: str, start_ts: int, end_ts: int
+    ) -> list[Step]:
+        """Get the steps of the grid of a station between start_ts and end_ts
+
+        Concurrent calls for the same station and window share a single fetch, and
+        results are reused for GRID_CACHE_TTL seconds to absorb bursts (e.g. several
+        entries reloading at once).
+        Calls made within GRID_BATCH_WINDOW seconds are sent together as a single
+        GraphQL request (one aliased grid field per station).
+        """
         if os.getenv("RADIOFRANCE_STUB"):
-            result = GRID_STUB
-        else:
-            async with Client(
-                transport=self._transport,
-                fetch_schema_from_transport=True,
-            ) as session:
-                query = gql(programs_query)
-                result = await session.execute(query)
-                _LOGGER.debug(result)
+            from .stubs import GRID_STUB
+
+            return [parse_step(p) for p in GRID_STUB["grid"]]
+        # align windows so that requests made a few seconds apart share the same key
+        start_ts -= start_ts % GRID_WINDOW_GRANULARITY
+        end_ts += -end_ts % GRID_WINDOW_GRANULARITY
+        key = (station_code, start_ts, end_ts)
+
+        cached = self._grid_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        future = self._inflight_grids.get(key)
+        if future is None:
+            future = self._queue_grid(station_code, start_ts, end_ts)
+            self._inflight_grids[key] = future
+            future.add_done_callback(functools.partial(self._grid_fetched, key))
+        # shield: a cancelled caller must not cancel the fetch shared with other callers
+        return await asyncio.shield(future)
+
+    def _queue_grid(
+        self, station_code: str, start_ts: int, end_ts: int
+    ) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        if station_code in self._pending_grids:
+            # widen the already queued window so that both callers get what they asked for
+            future, queued_start, queued_end = self._pending_grids[station_code]
+            self._pending_grids[station_code] = (
+                future,
+                min(queued_start, start_ts),
+                max(queued_end, end_ts),
+            )
+            return future
+        future = loop.create_future()
+        self._pending_grids[station_code] = (future, start_ts, end_ts)
+        if self._grid_batch_handle is None:
+            self._grid_batch_handle = loop.call_later(
+                GRID_BATCH_WINDOW,
+                lambda: loop.create_task(self._fetch_pending_grids()),
+            )
+        return future
+
+    def _grid_fetched(self, key: Tuple[str, int, int], future: asyncio.Future) -> None:
+        self._inflight_grids.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+        now = time.monotonic()
+        self._grid_cache = {k: v for k, v in self._grid_cache.items() if v[0] > now}
+        self._grid_cache[key] = (now + GRID_CACHE_TTL, future.result())
+
+    async def _fetch_pending_grids(self) -> None:
+        try:
+            # requests made while waiting for a token join this batch
+            await self.scheduler.acquire(PRIORITY_BACKGROUND, BACKGROUND_MAX_WAIT)
+            self.metrics.record("queue_wait", self.scheduler.last_wait * 1000)
+            error = None
+        except asyncio.TimeoutError:
+            error = RadioFranceApiRateLimited(
+                "Too many requests queued for this api token", BACKGROUND_MAX_WAIT
+            )
+        pending = self._pending_grids
+        self._pending_grids = {}
+        self._grid_batch_handle = None
+        if error is not None:
+            for future, _, _ in pending.values():
+                future.set_exception(error)
+            return
+        if len(pending) == 0:
+            # api was closed meanwhile
+            return
+
+        # alias of the grid of a station in the query -> station code
+        aliases = {}
+        variables = {}
+        for i, (code, (_, start_ts, end_ts)) in enumerate(pending.items()):
+            aliases[f"station_{i}"] = code
+            variables[f"start_{i}"] = start_ts
+            variables[f"end_{i}"] = end_ts
+            variables[f"station_{i}"] = code
+        _LOGGER.debug("Fetching grids %s", variables)
+        futures = {alias: pending[code][0] for alias, code in aliases.items()}
+        try:
+            errors = await self._stream_grids(
+                grid_query(len(futures)), variables, futures
+            )
+        except Exception as e:
+            e = self._handle_rate_limit(e)
+            errors = e
+        # grids missing from the response failed, while others may have succeeded
+        for alias, future in futures.items():
+            if future.done():
+                continue
+            if isinstance(errors, Exception):
+                future.set_exception(errors)
+            else:
+                future.set_exception(
+                    RadioFranceApiError(
+                        f"Unable to fetch grid for {aliases[alias]}: {errors}"
+                    )
+                )
+
+    async def _stream_grids(
+        self, query: str, variables: dict, futures: dict[str, asyncio.Future]
+    ) -> Optional[list]:
+        """Send the grid query and parse the response as it arrives
+
+        Entries are turned into steps as soon as they are received, so the raw
+        response is never held in memory as a whole, and the future of a station is
+        resolved once its grid is complete. Return the errors of the response.
+        """
+        await self._get_session()
+        # gql only parses whole responses, its transport session is used directly
+        transport = self._client.transport
+        payload = {"query": query, "variables": variables}
+        parser = GridStreamParser()
+        grids: dict[str, list[Step]] = {alias: [] for alias in futures}
+        # time spent decoding the grid of each alias, in seconds
+        parse_times = dict.fromkeys(futures, 0.0)
+        received = 0
+        self.metrics.record("batch_size", len(futures))
+        started = time.perf_counter()
+        async with transport.session.post(
+            transport.url, json=payload, ssl=transport.ssl
+        ) as response:
+            self.metrics.record(
+                "request_latency", (time.perf_counter() - started) * 1000
+            )
+            response.raise_for_status()
+            async for chunk in response.content.iter_chunked(GRID_STREAM_CHUNK_SIZE):
+                received += len(chunk)
+                parsed = time.perf_counter()
+                for event, alias, entry in parser.feed(chunk):
+                    if event == "step":
+                        # steps not selected by the query are empty
+                        if entry:
+                            grids[alias].append(parse_step(entry))
+                    else:
+                        self._grid_received(alias, variables[alias], grids, futures)
+                    # time since the previous event was spent on this alias
+                    now = time.perf_counter()
+                    parse_times[alias] += now - parsed
+                    parsed = now
+            parser.close()
+        self.metrics.record("response_time", (time.perf_counter() - started) * 1000)
+        self.metrics.record("bytes_received", received)
+        for alias, parse_time in parse_times.items():
+            # station codes are passed as $station_i, i.e. with the alias as name
+            self._station_metrics(variables[alias]).record(
+                "parse_time", parse_time * 1000
+            )
+        if "errors" in parser.extra:
+            _LOGGER.debug(
+                "Grid query returned errors: %s", _Abbreviated(parser.extra["errors"])
+            )
+        return parser.extra.get("errors")
 
-        return result["grid"]
+    async def get_live_tracks(
+        self, station_code: str, start_ts: int, end_ts: int
+    ) -> list[Step]:
+        """Get only the tracks of a station between start_ts and end_ts
+
+        Meant to follow closely what a music station plays: the query selects track
+        fields only and is sent right away, bypassing batching and the grid cache.
+        Raise RadioFranceApiRateLimited right away once live queries have used their
+        share of the quota (LIVE_QUOTA_SHARE).
+        """
+        if os.getenv("RADIOFRANCE_STUB"):
+            steps = await self.get_programs(station_code, start_ts, end_ts)
+            return [p for p in steps if p.kind == "track"]
+        if not self.live_budget.try_acquire():
+            raise RadioFranceApiRateLimited(
+                "Live queries used their share of the quota of this api token",
+                self.live_budget.next_token_in(),
+            )
+        try:
+            await self.scheduler.acquire(PRIORITY_LIVE, LIVE_MAX_WAIT)
+        except asyncio.TimeoutError:
+            raise RadioFranceApiRateLimited(
+                "Too many requests queued for this api token", LIVE_MAX_WAIT
+            )
+        future = asyncio.get_running_loop().create_future()
+        variables = {"start_0": start_ts, "end_0": end_ts, "station_0": station_code}
+        try:
+            errors = await self._stream_grids(
+                LIVE_TRACKS_QUERY, variables, {"station_0": future}
+            )
+        except Exception as e:
+            raise self._handle_rate_limit(e)
+        if not future.done():
+            raise RadioFranceApiError(
+                f"Unable to fetch tracks for {station_code}: {errors}"
+            )
+        return future.result()
+
+    def _grid_received(
+        self,
+        alias: str,
+        station_code: str,
+        grids: dict[str, list[Step]],
+        futures: dict[str, asyncio.Future],
+    ) -> None:
+        steps = grids.pop(alias)
+        _LOGGER.debug("Received %d steps for %s", len(steps), station_code)
+        self._station_metrics(station_code).record("steps", len(steps))
+        if not futures[alias].done():
+            futures[alias].set_result(steps)
+
+    def _station_metrics(self, station_code: str) -> Metrics:
+        metrics = self.station_metrics.get(station_code)
+        if metrics is None:
+            metrics = self.station_metrics[station_code] = Metrics()
+        return metrics
 
     async def get_stations(self) -> dict[str, str]:
         """Get stations list"""
 
-        station_list_query = """
-                query {
-                  brands {
-                     id
-                     title
-                     baseline
-                     description
-                     websiteUrl
-                     playerUrl
-                     liveStream
-                     localRadios {
-                       id
-                       title
-                       description
-                       liveStream
-                       playerUrl
-                     }
-                     webRadios {
-                       id
-                       title
-                       description
-                       liveStream
-                       playerUrl
-                     }
-                   }
-                }
-                """
-
         if os.getenv("RADIOFRANCE_STUB"):
+            from .stubs import STATIONS_LIST_STUB
+
             result = STATIONS_LIST_STUB
         else:
-            async with Client(
-                transport=self._transport,
-                fetch_schema_from_transport=True,
-            ) as session:
-                query = gql(station_list_query)
-                result = await session.execute(query)
-                _LOGGER.debug(result)
+            # someone is waiting in front of the config flow, serve before refreshes
+            await self.scheduler.acquire(PRIORITY_USER)
+            session = await self._get_session()
+            try:
+                with self.metrics.timer("stations_request"):
+                    result = await session.execute(self._stations_document)
+            except Exception as e:
+                raise self._handle_rate_limit(e)
+            _LOGGER.debug("Stations query returned %s", _Abbreviated(result))
         stations = {}
         for brand in result["brands"]:
             stations[brand["id"]] = brand["title"]
@@ -1,14 +1,14 @@
 import logging
 from datetime import timedelta
-import asyncio
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity import EntityPlatformState
 
 from .const import DOMAIN
-from . import AiringCalendar
+from . import AiringCalendar, RadioFranceAPICoordinator, station_added_signal
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,8 +16,13 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
-    api_coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    @callback
+    def add_station(api_coordinator: RadioFranceAPICoordinator) -> None:
+        async_add_entities([AiringCalendar(api_coordinator, hass, entry)])
 
-    async_add_entities([AiringCalendar(api_coordinator, hass, entry)])
-    await asyncio.sleep(0.2)  # FIXME: we should not need to sleep here!
-    await api_coordinator.async_request_refresh()
+    for api_coordinator in hass.data[DOMAIN][entry.entry_id]["stations"].values():
+        add_station(api_coordinator)
+    # stations added from the options later on
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, station_added_signal(entry), add_station)
+    )
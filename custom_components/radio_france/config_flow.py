@@ -1,14 +1,21 @@
+import hashlib
 import logging
+from datetime import datetime
 from typing import Any, Optional, Tuple
 import voluptuous as vol
 from homeassistant.core import callback, HomeAssistant
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.storage import Store
 from homeassistant import config_entries
 from .api import RadioFranceApi
 from .const import (
     DOMAIN,
     CONF_API_KEY,
-    CONF_RADIO_STATION,
+    CONF_RADIO_STATIONS,
+    CONF_HISTORY_RETENTION_DAYS,
+    DEFAULT_HISTORY_RETENTION_DAYS,
+    STORAGE_VERSION,
+    STATIONS_CACHE_TTL,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,15 +38,50 @@ API_KEY_SCHEMA = vol.Schema(
 
 
 async def get_radio_stations(hass: HomeAssistant, token: str) -> dict[str, str]:
+    """Return the station catalogue, from cache when fetched less than STATIONS_CACHE_TTL ago"""
+    # catalogues are stored by token hash to avoid writing tokens one more time on disk
+    token_key = hashlib.sha256(token.encode()).hexdigest()
+    now = int(datetime.now().timestamp())
+    store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.stations")
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "station_catalogues" not in domain_data:
+        domain_data["station_catalogues"] = await store.async_load() or {}
+    catalogues = domain_data["station_catalogues"]
+
+    cached = catalogues.get(token_key)
+    if cached is not None and now - cached["fetched_at"] < STATIONS_CACHE_TTL:
+        return cached["stations"]
+
+    stations = await fetch_radio_stations(hass, token)
+    catalogues[token_key] = {"fetched_at": now, "stations": stations}
+    await store.async_save(catalogues)
+    return stations
+
+
+async def fetch_radio_stations(hass: HomeAssistant, token: str) -> dict[str, str]:
+    # reuse the client of already configured entries if any
+    shared = hass.data.get(DOMAIN, {}).get("apis", {}).get(token)
+    if shared is not None:
+        return await shared["api"].get_stations()
+    client = RadioFranceApi(token)
     try:
-        client = RadioFranceApi(token)
         return await client.get_stations()
-    except ValueError as exc:
-        raise exc
+    finally:
+        await client.close()
+
+
+def stations_schema(all_stations: dict[str, str], selected: list[str]) -> dict:
+    """Return the schema field to pick stations, keeping selected ones pickable"""
+    # a station may have left the catalogue since it was selected
+    choices = {**{code: code for code in selected}, **all_stations}
+    return {
+        vol.Required(CONF_RADIO_STATIONS, default=selected): cv.multi_select(choices)
+    }
 
 
 class SetupConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
-    VERSION = 1
+    # 2: several stations per entry
+    VERSION = 2
 
     def __init__(self):
         """Initialize"""
@@ -67,21 +109,62 @@ class SetupConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self._show_setup_form("user", user_input, API_KEY_SCHEMA, errors)
 
     async def async_step_radio_station_selection(self, user_input=None):
-        """Handle selection of radio station amongst possible values"""
+        """Handle selection of radio stations amongst possible values"""
         errors = {}
         if user_input is not None:
-            radio_station = user_input.get(CONF_RADIO_STATION)
-            self.data[CONF_RADIO_STATION] = radio_station
-            return self.async_create_entry(title="radio_france", data=self.data)
+            if len(user_input[CONF_RADIO_STATIONS]) == 0:
+                errors["base"] = "no_station_selected"
+            else:
+                self.data[CONF_RADIO_STATIONS] = user_input[CONF_RADIO_STATIONS]
+                return self.async_create_entry(title="radio_france", data=self.data)
         all_stations = await get_radio_stations(self.hass, self.data[CONF_API_KEY])
         default_station = list(all_stations.keys())[0]
         RADIO_STATIONS_SCHEMA = vol.Schema(
-            {
-                vol.Required(CONF_RADIO_STATION, default=default_station): vol.In(
-                    all_stations
-                )
-            }
+            stations_schema(all_stations, [default_station])
         )
         return self._show_setup_form(
             "radio_station_selection", None, RADIO_STATIONS_SCHEMA, errors
         )
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        return OptionsFlowHandler(config_entry)
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Change the stations of an entry and how long their history is kept
+
+    Stations added or removed are set up or torn down without reloading the entry
+    (see update_entry in __init__.py).
+    """
+
+    def __init__(self, config_entry: config_entries.ConfigEntry):
+        self.config_entry = config_entry
+
+    async def async_step_init(self, user_input: Optional[dict[str, Any]] = None):
+        errors = {}
+        if user_input is not None:
+            if len(user_input[CONF_RADIO_STATIONS]) == 0:
+                errors["base"] = "no_station_selected"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+        options = self.config_entry.options
+        selected = options.get(
+            CONF_RADIO_STATIONS, self.config_entry.data[CONF_RADIO_STATIONS]
+        )
+        all_stations = await get_radio_stations(
+            self.hass, self.config_entry.data[CONF_API_KEY]
+        )
+        schema = vol.Schema(
+            {
+                **stations_schema(all_stations, selected),
+                vol.Required(
+                    CONF_HISTORY_RETENTION_DAYS,
+                    default=options.get(
+                        CONF_HISTORY_RETENTION_DAYS, DEFAULT_HISTORY_RETENTION_DAYS
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=365)),
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
@@ -0,0 +1,119 @@
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_API_KEY, GRID_STALE_KIND
+
+TO_REDACT = {CONF_API_KEY}
+
+# measures for which a histogram of recent values is included
+HISTOGRAM_METRICS = (
+    "refresh",
+    "fetch",
+    "live_fetch",
+    "merge",
+    "listeners",
+    "entity_update",
+)
+
+
+def _isoformat(ts: Optional[int]) -> Optional[str]:
+    if not ts:
+        return None
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return the grid of each station of the entry, its refresh schedule and metrics"""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    stations = {
+        station: _station_diagnostics(coordinator)
+        for station, coordinator in entry_data["stations"].items()
+    }
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "setup_timing": entry_data.get("setup_timing"),
+        "stations": stations,
+    }
+
+
+def _api_diagnostics(api) -> dict[str, Any]:
+    return {
+        "metrics": api.metrics.as_dict(),
+        "histograms": api.metrics.histograms(
+            ("request_latency", "response_time", "queue_wait")
+        ),
+        "scheduler": {
+            "queue_depth": api.scheduler.queue_depth,
+            "last_wait": round(api.scheduler.last_wait, 3),
+            "max_wait": round(api.scheduler.max_wait, 3),
+            "served": api.scheduler.served,
+            "rejected": api.scheduler.rejected,
+        },
+        "live_budget": {
+            "served": api.live_budget.served,
+            "rejected": api.live_budget.rejected,
+            "next_token_in": round(api.live_budget.next_token_in(), 3),
+        },
+    }
+
+
+def _station_diagnostics(coordinator) -> dict[str, Any]:
+    timeline = coordinator.data
+    station_metrics = coordinator.api.station_metrics.get(coordinator.station_code)
+    now = int(datetime.now().timestamp())
+
+    coverage = None
+    if timeline is not None:
+        coverage = {
+            "steps": len(timeline),
+            "first_start": _isoformat(timeline.first_start),
+            "last_end": _isoformat(timeline.last_end),
+            "last_end_by_kind": {
+                kind: _isoformat(end) for kind, end in timeline.last_ends().items()
+            },
+            "frontier": _isoformat(timeline.frontier(now - GRID_STALE_KIND)),
+            "covers_now": coordinator.covers_now(),
+        }
+    next_refresh = None
+    if coordinator.last_refresh_at is not None:
+        next_refresh = (
+            coordinator.last_refresh_at + coordinator.update_interval
+        ).isoformat()
+
+    return {
+        "coverage": coverage,
+        "schedule": {
+            "last_update_success": coordinator.last_update_success,
+            "last_refresh": (
+                coordinator.last_refresh_at.isoformat()
+                if coordinator.last_refresh_at is not None
+                else None
+            ),
+            "last_full_fetch": _isoformat(coordinator._last_full_fetch),
+            "update_interval": str(coordinator.update_interval),
+            "next_refresh": next_refresh,
+            "failed_refreshes": coordinator._failed_refreshes,
+            "live": coordinator.live,
+        },
+        # client of the token of the entry which created the (shared) coordinator
+        "api": _api_diagnostics(coordinator.api),
+        "metrics": coordinator.metrics.as_dict(),
+        "histograms": coordinator.metrics.histograms(HISTOGRAM_METRICS),
+        "grid_metrics": {} if station_metrics is None else station_metrics.as_dict(),
+        "grid_histograms": (
+            {}
+            if station_metrics is None
+            else station_metrics.histograms(("parse_time",))
+        ),
+        "grid": (
+            []
+            if timeline is None
+            else async_redact_data([p.to_dict() for p in timeline], TO_REDACT)
+        ),
+    }
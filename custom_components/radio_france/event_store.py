@@ -0,0 +1,85 @@
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+
+from homeassistant.components.calendar import CalendarEvent
+
+from .interval_index import IntervalIndex
+from .steps import Step
+
+
+class EventStore:
+    """Calendar events built from grid steps, kept by step id
+
+    sync() only builds events for new or changed steps and drops events of steps which
+    left the grid, so the cost of an update depends on what changed rather than on the
+    size of the grid. Events are indexed by start, the index being updated along with
+    events, to answer range queries without going through all events.
+    """
+
+    def __init__(self, build_event: Callable[[Step], Optional[CalendarEvent]]):
+        self._build_event = build_event
+        # step id -> (step, event)
+        self._entries: dict[str, tuple[Step, CalendarEvent]] = {}
+        self._index: IntervalIndex[CalendarEvent] = IntervalIndex(
+            lambda e: e.start, lambda e: e.end
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def sync(self, steps: Iterable[Step]) -> int:
+        """Update events to match steps, return the number of events added, changed or removed"""
+        seen = set()
+        changes = 0
+        for p in steps:
+            seen.add(p.id)
+            known = self._entries.get(p.id)
+            if known is not None and (known[0] is p or known[0] == p):
+                continue
+            event = self._build_event(p)
+            if event is None:
+                continue
+            self._set(p, event)
+            changes += 1
+        for step_id in self._entries.keys() - seen:
+            changes += self._remove(step_id)
+        return changes
+
+    def apply(self, steps: Iterable[Step], removed_ids: Iterable[str]) -> int:
+        """Update events of the given new or changed steps and drop events of removed steps
+
+        Cheaper than sync() when the caller knows what changed (see Timeline.diff).
+        Return the number of events added, changed or removed.
+        """
+        changes = 0
+        for p in steps:
+            event = self._build_event(p)
+            if event is None:
+                # e.g. a blank step which lost its title
+                changes += self._remove(p.id)
+                continue
+            self._set(p, event)
+            changes += 1
+        for step_id in removed_ids:
+            changes += self._remove(step_id)
+        return changes
+
+    def _set(self, p: Step, event: CalendarEvent) -> None:
+        self._entries[p.id] = (p, event)
+        self._index.add(p.id, event)
+
+    def _remove(self, step_id: str) -> bool:
+        if self._entries.pop(step_id, None) is None:
+            return False
+        self._index.remove(step_id)
+        return True
+
+    def between(self, start: datetime, end: datetime) -> list[CalendarEvent]:
+        """Return events overlapping [start, end], sorted by start"""
+        return self._index.overlapping(start, end)
+
+    def at(self, moment: datetime) -> list[CalendarEvent]:
+        """Return events running at moment, shortest first"""
+        events = self._index.overlapping(moment, moment)
+        events.sort(key=lambda e: e.end - e.start)
+        return events
@@ -0,0 +1,178 @@
+import codecs
+import json
+from typing import Any, Iterator, Optional, Tuple
+
+_WHITESPACE = " \t\n\r"
+
+# parser states
+_TOP_START = 0
+_TOP_KEY = 1
+_TOP_COLON = 2
+_TOP_VALUE = 3
+_DATA_VALUE = 4
+_DATA_KEY = 5
+_DATA_COLON = 6
+_GRID_VALUE = 7
+_GRID_ITEM = 8
+_DONE = 9
+
+
+class GridStreamParser:
+    """Incremental parser of a (batched) grid query response
+
+    Bytes are fed as they arrive and grid entries are yielded as soon as they are
+    complete, as ("step", alias, entry) events, followed by ("end", alias, None)
+    once the grid of an alias is complete. Only the entry being received is kept in
+    memory, so memory use does not depend on the size of the grid.
+    Grids which are null and other top level members (errors) are decoded as a
+    whole and available as null_grids and extra once the response is complete.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _TOP_START
+        self._key: Optional[str] = None
+        self._alias: Optional[str] = None
+        self.null_grids: set[str] = set()
+        self.extra: dict[str, Any] = {}
+
+    def feed(self, chunk: bytes) -> Iterator[Tuple[str, str, Optional[dict]]]:
+        """Parse a chunk of the response, yield the events it completes"""
+        self._buffer = self._buffer[self._pos :] + self._decoder.decode(chunk)
+        self._pos = 0
+        yield from self._parse()
+
+    def close(self) -> None:
+        """Check that the whole response was received"""
+        self._buffer = self._buffer[self._pos :] + self._decoder.decode(b"", True)
+        self._pos = 0
+        for _ in self._parse():
+            pass
+        if self._state != _DONE:
+            raise ValueError("Truncated grid response")
+
+    def _skip(self, separators: str = _WHITESPACE) -> Optional[str]:
+        """Skip separators, return the next character or None if more data is needed"""
+        while self._pos < len(self._buffer) and self._buffer[self._pos] in separators:
+            self._pos += 1
+        if self._pos < len(self._buffer):
+            return self._buffer[self._pos]
+        return None
+
+    def _expect(self, char: str) -> bool:
+        c = self._skip()
+        if c is None:
+            return False
+        if c != char:
+            raise ValueError(
+                f"Unexpected {c!r} at {self._pos} of grid response, expected {char!r}"
+            )
+        self._pos += 1
+        return True
+
+    def _value(self) -> Tuple[bool, Any]:
+        """Decode a whole json value, return (False, None) if it is not complete yet"""
+        if self._skip() is None:
+            return False, None
+        try:
+            value, end = self._json.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            # most likely cut in the middle, invalid content is reported by close()
+            return False, None
+        if end == len(self._buffer) and not isinstance(value, (dict, list, str)):
+            # a literal at the end of the buffer may continue in the next chunk
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _parse(self) -> Iterator[Tuple[str, str, Optional[dict]]]:
+        while True:
+            state = self._state
+            if state == _DONE:
+                return
+            if state == _TOP_START:
+                if not self._expect("{"):
+                    return
+                self._state = _TOP_KEY
+            elif state == _TOP_KEY:
+                c = self._skip(_WHITESPACE + ",")
+                if c is None:
+                    return
+                if c == "}":
+                    self._pos += 1
+                    self._state = _DONE
+                    continue
+                complete, self._key = self._value()
+                if not complete:
+                    return
+                self._state = _TOP_COLON
+            elif state == _TOP_COLON:
+                if not self._expect(":"):
+                    return
+                self._state = _DATA_VALUE if self._key == "data" else _TOP_VALUE
+            elif state == _TOP_VALUE:
+                complete, value = self._value()
+                if not complete:
+                    return
+                self.extra[self._key] = value
+                self._state = _TOP_KEY
+            elif state == _DATA_VALUE:
+                c = self._skip()
+                if c is None:
+                    return
+                if c == "{":
+                    self._pos += 1
+                    self._state = _DATA_KEY
+                    continue
+                complete, value = self._value()
+                if not complete:
+                    return
+                self.extra["data"] = value
+                self._state = _TOP_KEY
+            elif state == _DATA_KEY:
+                c = self._skip(_WHITESPACE + ",")
+                if c is None:
+                    return
+                if c == "}":
+                    self._pos += 1
+                    self._state = _TOP_KEY
+                    continue
+                complete, self._alias = self._value()
+                if not complete:
+                    return
+                self._state = _DATA_COLON
+            elif state == _DATA_COLON:
+                if not self._expect(":"):
+                    return
+                self._state = _GRID_VALUE
+            elif state == _GRID_VALUE:
+                c = self._skip()
+                if c is None:
+                    return
+                if c == "[":
+                    self._pos += 1
+                    self._state = _GRID_ITEM
+                    continue
+                complete, value = self._value()
+                if not complete:
+                    return
+                if value is not None:
+                    raise ValueError(f"Unexpected grid for {self._alias}: {value!r}")
+                self.null_grids.add(self._alias)
+                self._state = _DATA_KEY
+            elif state == _GRID_ITEM:
+                c = self._skip(_WHITESPACE + ",")
+                if c is None:
+                    return
+                if c == "]":
+                    self._pos += 1
+                    self._state = _DATA_KEY
+                    yield "end", self._alias, None
+                    continue
+                complete, value = self._value()
+                if not complete:
+                    return
+                yield "step", self._alias, value
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import logging
+import os
+import shutil
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import DOMAIN
+from .steps import Step, parse_step
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _day_of(ts: int) -> date:
+    return datetime.fromtimestamp(ts, timezone.utc).date()
+
+
+def history_dir(hass: HomeAssistant, station_code: str) -> str:
+    return hass.config.path(STORAGE_DIR, f"{DOMAIN}_history", station_code)
+
+
+async def async_remove_history(hass: HomeAssistant, station_code: str) -> None:
+    """Delete all the history segments of a station"""
+    await hass.async_add_executor_job(
+        shutil.rmtree, history_dir(hass, station_code), True
+    )
+
+
+class HistoryStore:
+    """On-disk history of the grid steps of a station, beyond the api window
+
+    Steps are appended to one json lines segment per (UTC) day of their start, a
+    step being appended again when it changes. Range reads only open the segments
+    of the requested days. Compaction drops segments older than the retention and
+    rewrites past segments without duplicates.
+    All file accesses happen in the executor. Appends and compactions are serialised,
+    a compaction rewriting a segment would otherwise lose lines appended meanwhile.
+    """
+
+    def __init__(self, hass: HomeAssistant, station_code: str, retention_days: int):
+        self.hass = hass
+        self.retention_days = retention_days
+        self._dir = history_dir(hass, station_code)
+        # step id -> step as last appended during this run
+        self._appended: dict[str, Step] = {}
+        self._compacted_days: set[date] = set()
+        self._last_compaction: date = date.min
+        self._write_lock = asyncio.Lock()
+
+    def set_retention_days(self, retention_days: int) -> None:
+        if retention_days != self.retention_days:
+            self.retention_days = retention_days
+            # apply a shorter retention at the next append rather than tomorrow
+            self._last_compaction = date.min
+
+    async def async_append(self, steps: Iterable[Step]) -> None:
+        """Append steps which are new or changed since they were last appended"""
+        # refreshes and live queries append concurrently
+        async with self._write_lock:
+            await self._async_append(steps)
+
+    async def _async_append(self, steps: Iterable[Step]) -> None:
+        segments: dict[date, list[dict]] = {}
+        for p in steps:
+            if self._appended.get(p.id) == p:
+                continue
+            self._appended[p.id] = p
+            segments.setdefault(_day_of(p.start), []).append(p.to_dict())
+        if len(segments) > 0:
+            await self.hass.async_add_executor_job(self._append, segments)
+        today = datetime.now(timezone.utc).date()
+        if self._last_compaction < today:
+            self._last_compaction = today
+            oldest_kept = today - timedelta(days=self.retention_days)
+            cutoff = datetime.combine(oldest_kept, time(), timezone.utc).timestamp()
+            # steps that old are out of the grid and would be dropped from disk anyway
+            self._appended = {
+                step_id: p for step_id, p in self._appended.items() if p.end >= cutoff
+            }
+            await self.hass.async_add_executor_job(self._compact, today)
+
+    async def async_read(self, start_ts: int, end_ts: int) -> list[Step]:
+        """Return steps overlapping [start_ts, end_ts], sorted by start"""
+        return await self.hass.async_add_executor_job(self._read, start_ts, end_ts)
+
+    def _path(self, day: date) -> str:
+        return os.path.join(self._dir, f"{day.isoformat()}.jsonl")
+
+    def _append(self, segments: dict[date, list[dict]]) -> None:
+        os.makedirs(self._dir, exist_ok=True)
+        for day, steps in segments.items():
+            with open(self._path(day), "a", encoding="utf-8") as f:
+                for p in steps:
+                    f.write(json.dumps(p, separators=(",", ":")) + "\n")
+
+    def _read_segment(self, day: date) -> dict[str, dict]:
+        steps = {}
+        try:
+            with open(self._path(day), encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        p = json.loads(line)
+                    except ValueError:
+                        # an interrupted write leaves a truncated last line
+                        continue
+                    # last version of a step wins
+                    steps[p["id"]] = p
+        except FileNotFoundError:
+            pass
+        return steps
+
+    def _read(self, start_ts: int, end_ts: int) -> list[Step]:
+        steps = []
+        # steps starting the day before can run past midnight
+        day = _day_of(start_ts) - timedelta(days=1)
+        last_day = _day_of(end_ts)
+        while day <= last_day:
+            steps.extend(
+                p
+                for p in self._read_segment(day).values()
+                if p["end"] >= start_ts and p["start"] <= end_ts
+            )
+            day += timedelta(days=1)
+        steps.sort(key=lambda p: p["start"])
+        return [parse_step(p) for p in steps]
+
+    def _compact(self, today: date) -> None:
+        try:
+            names = os.listdir(self._dir)
+        except FileNotFoundError:
+            return
+        oldest_kept = today - timedelta(days=self.retention_days)
+        for name in names:
+            try:
+                day = date.fromisoformat(name.removesuffix(".jsonl"))
+            except ValueError:
+                continue
+            if day < oldest_kept:
+                _LOGGER.debug(f"Removing history segment {name}")
+                os.remove(os.path.join(self._dir, name))
+            elif day < today and day not in self._compacted_days:
+                # past segments will not receive many more steps, rewrite them without duplicates
+                steps = self._read_segment(day)
+                tmp_path = self._path(day) + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    for p in sorted(steps.values(), key=lambda p: p["start"]):
+                        f.write(json.dumps(p, separators=(",", ":")) + "\n")
+                os.replace(tmp_path, self._path(day))
+                self._compacted_days.add(day)
@@ -0,0 +1,65 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class IntervalIndex(Generic[T]):
+    """Items with closed [start, end] intervals, indexed by key for overlap queries
+
+    Items are kept sorted by start, along with the sorted durations of all items: the
+    items overlapping [lo, hi] all start between lo minus the longest duration and hi.
+    Adding or removing an item costs a bisection (and a list shift), so updates cost
+    what changed rather than rebuilding the index.
+    """
+
+    def __init__(self, start_of: Callable[[T], Any], end_of: Callable[[T], Any]):
+        self._start_of = start_of
+        self._end_of = end_of
+        # key -> item
+        self._items: dict[Hashable, T] = {}
+        # parallel lists sorted by start
+        self._starts: list = []
+        self._keys: list[Hashable] = []
+        self._durations: list = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, key: Hashable, item: T) -> None:
+        """Add an item, replacing the one with the same key if any"""
+        self.remove(key)
+        start = self._start_of(item)
+        i = bisect_right(self._starts, start)
+        self._starts.insert(i, start)
+        self._keys.insert(i, key)
+        insort(self._durations, self._end_of(item) - start)
+        self._items[key] = item
+
+    def remove(self, key: Hashable) -> None:
+        """Remove the item with the given key, if any"""
+        item = self._items.pop(key, None)
+        if item is None:
+            return
+        start = self._start_of(item)
+        i = bisect_left(self._starts, start)
+        # items starting at the same time are few
+        while self._keys[i] != key:
+            i += 1
+        del self._starts[i]
+        del self._keys[i]
+        duration = self._end_of(item) - start
+        del self._durations[bisect_left(self._durations, duration)]
+
+    def overlapping(self, lo: Any, hi: Any) -> list[T]:
+        """Return items whose interval overlaps [lo, hi], sorted by start"""
+        if len(self._items) == 0:
+            return []
+        first = bisect_left(self._starts, lo - self._durations[-1])
+        last = bisect_right(self._starts, hi)
+        found = []
+        for key in self._keys[first:last]:
+            item = self._items[key]
+            if self._end_of(item) >= lo:
+                found.append(item)
+        return found
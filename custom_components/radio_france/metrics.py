@@ -0,0 +1,110 @@
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional
+
+# recent values kept per measure, for histograms
+METRIC_SAMPLES = 200
+# upper bounds of histogram buckets, in the unit of the measure (ms for durations)
+HISTOGRAM_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+class Metric:
+    """Running summary of the values recorded for a measure
+
+    The last METRIC_SAMPLES values are kept in a ring buffer, so memory use does not
+    grow with uptime.
+    """
+
+    __slots__ = ("last", "count", "total", "max", "samples")
+
+    def __init__(self):
+        self.last = 0.0
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: deque[float] = deque(maxlen=METRIC_SAMPLES)
+
+    def record(self, value: float) -> None:
+        self.last = value
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        self.samples.append(value)
+
+    def histogram(self) -> dict[str, int]:
+        """Return how many recent values fall in each bucket, keyed by upper bound"""
+        counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        for value in self.samples:
+            counts[bisect_left(HISTOGRAM_BUCKETS, value)] += 1
+        labels = [f"<={bound}" for bound in HISTOGRAM_BUCKETS] + [
+            f">{HISTOGRAM_BUCKETS[-1]}"
+        ]
+        return {label: n for label, n in zip(labels, counts) if n > 0}
+
+    def percentile(self, p: float) -> float:
+        """Return the p-th percentile (0-100) of recent values"""
+        if len(self.samples) == 0:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "last": round(self.last, 3),
+            "mean": round(self.mean, 3),
+            "max": round(self.max, 3),
+            "count": self.count,
+        }
+
+
+class Metrics:
+    """Named measures of the refresh path, cheap enough to be always recorded
+
+    Durations are recorded in milliseconds. Values are only formatted when read,
+    by diagnostic sensors or the diagnostics platform.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def record(self, name: str, value: float) -> None:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = Metric()
+        metric.record(value)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Record the time spent in the block, in milliseconds"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - started) * 1000)
+
+    def get(self, name: str) -> Optional[Metric]:
+        return self._metrics.get(name)
+
+    def as_dict(self) -> dict:
+        return {name: metric.as_dict() for name, metric in self._metrics.items()}
+
+    def histograms(self, names: Iterable[str]) -> dict:
+        """Return histograms and percentiles of the recent values of the given measures"""
+        histograms = {}
+        for name in names:
+            metric = self._metrics.get(name)
+            if metric is None:
+                continue
+            histograms[name] = {
+                "p50": round(metric.percentile(50), 3),
+                "p90": round(metric.percentile(90), 3),
+                "p99": round(metric.percentile(99), 3),
+                "buckets": metric.histogram(),
+            }
+        return histograms
@@ -0,0 +1,116 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Optional
+
+# requests made on behalf of a user (config flow) are served first, then live
+# requests following what plays now, then background refreshes
+PRIORITY_USER = 0
+PRIORITY_LIVE = 1
+PRIORITY_BACKGROUND = 2
+
+
+class RequestScheduler:
+    """Token bucket shared by all requests made with a given api token
+
+    Requests wait for a token in a priority queue. The bucket holds up to capacity
+    tokens and refills at rate tokens per second. When the api asks to slow down
+    (429, Retry-After), no request is served until the given delay is over.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        # (priority, sequence, future)
+        self._queue: list = []
+        self._sequence = itertools.count()
+        self._dispatch_handle: Optional[asyncio.TimerHandle] = None
+        self.last_wait = 0.0
+        self.max_wait = 0.0
+        self.served = 0
+        self.rejected = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, future in self._queue if not future.done())
+
+    def penalize(self, retry_after: float) -> None:
+        """Stop serving requests for retry_after seconds, as asked by the api"""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+        self._tokens = 0
+        self._schedule_dispatch()
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available right away, without waiting in the queue"""
+        now = time.monotonic()
+        self._refill(now)
+        if now < self._blocked_until or self._tokens < 1 or self.queue_depth > 0:
+            self.rejected += 1
+            return False
+        self._tokens -= 1
+        self.served += 1
+        self.last_wait = 0.0
+        return True
+
+    def next_token_in(self) -> float:
+        """Return how many seconds until a token is available, ignoring queued requests"""
+        now = time.monotonic()
+        self._refill(now)
+        return max(self._blocked_until - now, (1 - self._tokens) / self.rate, 0.0)
+
+    async def acquire(self, priority: int, max_wait: Optional[float] = None) -> None:
+        """Wait for a token. Raise asyncio.TimeoutError if it takes more than max_wait seconds"""
+        queued_at = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority, next(self._sequence), future))
+        if self._dispatch_handle is None:
+            self._dispatch()
+        try:
+            # on timeout the future is cancelled and skipped by the dispatcher
+            await asyncio.wait_for(future, max_wait)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise
+        self.served += 1
+        self.last_wait = time.monotonic() - queued_at
+        self.max_wait = max(self.max_wait, self.last_wait)
+
+    def _schedule_dispatch(self) -> None:
+        if self._dispatch_handle is not None:
+            self._dispatch_handle.cancel()
+        self._dispatch_handle = None
+        self._dispatch()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def _dispatch(self) -> None:
+        self._dispatch_handle = None
+        now = time.monotonic()
+        self._refill(now)
+        while len(self._queue) > 0:
+            _, _, future = self._queue[0]
+            if future.done():
+                heapq.heappop(self._queue)
+                continue
+            if now < self._blocked_until:
+                delay = self._blocked_until - now
+                break
+            if self._tokens < 1:
+                delay = (1 - self._tokens) / self.rate
+                break
+            heapq.heappop(self._queue)
+            self._tokens -= 1
+            future.set_result(None)
+        else:
+            return
+        self._dispatch_handle = asyncio.get_running_loop().call_later(
+            delay, self._dispatch
+        )
@@ -1,14 +1,21 @@
 import logging
 from datetime import timedelta
-import asyncio
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity import EntityPlatformState
 
 from .const import DOMAIN
-from . import AiringNowTrackEntity, AiringNowProgramEntity
+from . import (
+    AiringNowTrackEntity,
+    AiringNowProgramEntity,
+    RefreshMetricSensor,
+    RadioFranceAPICoordinator,
+    METRIC_SENSORS,
+    station_added_signal,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,11 +23,18 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
-    api_coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    sensors = []
-    sensors.append(AiringNowProgramEntity(api_coordinator, hass, entry))
-    sensors.append(AiringNowTrackEntity(api_coordinator, hass, entry))
+    @callback
+    def add_station(api_coordinator: RadioFranceAPICoordinator) -> None:
+        sensors = []
+        sensors.append(AiringNowProgramEntity(api_coordinator, hass, entry))
+        sensors.append(AiringNowTrackEntity(api_coordinator, hass, entry))
+        for metric in METRIC_SENSORS:
+            sensors.append(RefreshMetricSensor(api_coordinator, entry, *metric))
+        async_add_entities(sensors)
 
-    async_add_entities(sensors)
-    await asyncio.sleep(0.2)  # FIXME: we should not need to sleep here!
-    await api_coordinator.async_request_refresh()
+    for api_coordinator in hass.data[DOMAIN][entry.entry_id]["stations"].values():
+        add_station(api_coordinator)
+    # stations added from the options later on
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, station_added_signal(entry), add_station)
+    )
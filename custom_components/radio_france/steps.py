@@ -0,0 +1,121 @@
+import sys
+from typing import Optional
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return None if value is None else sys.intern(value)
+
+
+class Step:
+    """A step of a station grid, as returned by the grid query
+
+    Steps are parsed once per fetch and shared by sensors and calendar. They use
+    __slots__ and interned strings for values repeated across steps (artists,
+    albums) to keep long track grids small in memory.
+    """
+
+    __slots__ = ("id", "start", "end")
+    kind = ""
+    _fields: tuple = __slots__
+
+    def __init__(self, id: str, start: int, end: int):
+        self.id = id
+        self.start = start
+        self.end = end
+
+    def __eq__(self, other) -> bool:
+        return type(self) is type(other) and all(
+            getattr(self, f) == getattr(other, f) for f in self._fields
+        )
+
+    __hash__ = None
+
+    def fingerprint(self) -> int:
+        """Return a hash of the content of the step, to cheaply tell whether it changed"""
+        return hash(tuple(getattr(self, f) for f in self._fields))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{f}={getattr(self, f)!r}' for f in self._fields)})"
+
+    def to_dict(self) -> dict:
+        """Return the step in the shape of the api response"""
+        return {"id": self.id, "start": self.start, "end": self.end}
+
+
+class DiffusionStep(Step):
+    __slots__ = ("diffusion_id", "title", "stand_first", "published_date", "url")
+    kind = "diffusion"
+    _fields = Step.__slots__ + __slots__
+
+    def __init__(self, p: dict):
+        super().__init__(p["id"], p["start"], p["end"])
+        diffusion = p["diffusion"]
+        self.diffusion_id = diffusion.get("id")
+        self.title = diffusion.get("title")
+        self.stand_first = diffusion.get("standFirst")
+        self.published_date = diffusion.get("published_date")
+        self.url = diffusion.get("url")
+
+    def to_dict(self) -> dict:
+        return {
+            **super().to_dict(),
+            "diffusion": {
+                "id": self.diffusion_id,
+                "title": self.title,
+                "standFirst": self.stand_first,
+                "published_date": self.published_date,
+                "url": self.url,
+            },
+        }
+
+
+class TrackStep(Step):
+    __slots__ = ("track_id", "title", "authors", "main_artists", "album_title")
+    kind = "track"
+    _fields = Step.__slots__ + __slots__
+
+    def __init__(self, p: dict):
+        super().__init__(p["id"], p["start"], p["end"])
+        track = p["track"]
+        self.track_id = track.get("id")
+        self.title = track.get("title")
+        self.authors = tuple(_intern(a) for a in track.get("authors") or [])
+        self.main_artists = tuple(_intern(a) for a in track.get("mainArtists") or [])
+        self.album_title = _intern(track.get("albumTitle"))
+
+    def to_dict(self) -> dict:
+        return {
+            **super().to_dict(),
+            "track": {
+                "id": self.track_id,
+                "title": self.title,
+                "authors": list(self.authors),
+                "mainArtists": list(self.main_artists),
+                "albumTitle": self.album_title,
+            },
+        }
+
+
+class BlankStep(Step):
+    __slots__ = ("title",)
+    kind = "blank"
+    _fields = Step.__slots__ + __slots__
+
+    def __init__(self, p: dict):
+        super().__init__(p["id"], p["start"], p["end"])
+        self.title = _intern(p.get("title"))
+
+    def to_dict(self) -> dict:
+        return {**super().to_dict(), "title": self.title}
+
+
+STEP_KINDS = ("diffusion", "track", "blank")
+
+
+def parse_step(p: dict) -> Step:
+    """Build a step from a grid entry of the api response"""
+    if p.get("track") is not None:
+        return TrackStep(p)
+    if p.get("diffusion") is not None:
+        return DiffusionStep(p)
+    return BlankStep(p)
@@ -0,0 +1,170 @@
+from bisect import bisect_right
+from typing import Iterator, Optional
+
+from .steps import STEP_KINDS, Step, parse_step
+
+
+class TimelineDelta:
+    """Ids of the steps added, removed or changed between two timelines"""
+
+    __slots__ = ("added", "removed", "changed")
+
+    def __init__(self, added: set[str], removed: set[str], changed: set[str]):
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def __repr__(self) -> str:
+        return f"TimelineDelta(added={len(self.added)}, removed={len(self.removed)}, changed={len(self.changed)})"
+
+
+class Timeline:
+    """Grid of a station, indexed to find quickly which step airs at a given time
+
+    Steps of each kind are kept in separate arrays sorted by start so that the step
+    airing at a given time is found with a bisection. Steps of a kind may be nested
+    (e.g. a diffusion within a longer one): the greatest end of the steps starting
+    before each index tells how far back to look for steps still airing.
+    """
+
+    def __init__(self, steps: list[Step]):
+        self.steps = sorted(steps, key=lambda p: p.start)
+        self._steps = {kind: [] for kind in STEP_KINDS}
+        self._starts = {kind: [] for kind in STEP_KINDS}
+        self._ends = {kind: [] for kind in STEP_KINDS}
+        self._max_ends = {kind: [] for kind in STEP_KINDS}
+        for p in self.steps:
+            max_ends = self._max_ends[p.kind]
+            self._steps[p.kind].append(p)
+            self._starts[p.kind].append(p.start)
+            self._ends[p.kind].append(p.end)
+            max_ends.append(max(p.end, max_ends[-1]) if max_ends else p.end)
+        self._fingerprint: Optional[int] = None
+
+    @classmethod
+    def from_grid(cls, grid: list[dict]) -> "Timeline":
+        """Build a timeline from the grid returned by the api"""
+        return cls([parse_step(p) for p in grid])
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __iter__(self) -> Iterator[Step]:
+        return iter(self.steps)
+
+    @property
+    def fingerprint(self) -> int:
+        """Hash of the content of all steps, computed once"""
+        if self._fingerprint is None:
+            self._fingerprint = hash(tuple(p.fingerprint() for p in self.steps))
+        return self._fingerprint
+
+    def __eq__(self, other) -> bool:
+        # fingerprints tell most differences apart without comparing every field
+        return (
+            isinstance(other, Timeline)
+            and (self is other or self.fingerprint == other.fingerprint)
+            and self.steps == other.steps
+        )
+
+    __hash__ = None
+
+    def diff(self, previous: Optional["Timeline"]) -> TimelineDelta:
+        """Return what changed since the previous timeline (everything is added if None)"""
+        if previous is None:
+            return TimelineDelta({p.id for p in self.steps}, set(), set())
+        previous_by_id = {p.id: p for p in previous.steps}
+        added = set()
+        changed = set()
+        for p in self.steps:
+            known = previous_by_id.pop(p.id, None)
+            if known is None:
+                added.add(p.id)
+            # merged timelines share unchanged instances
+            elif known is not p and known != p:
+                changed.add(p.id)
+        return TimelineDelta(added, set(previous_by_id), changed)
+
+    @property
+    def first_start(self) -> int:
+        return self.steps[0].start if self.steps else 0
+
+    @property
+    def last_end(self) -> int:
+        return max((p.end for p in self.steps), default=0)
+
+    def _airing(self, kind: str, now: int) -> Iterator[int]:
+        """Yield the indexes of the steps of the given kind airing at now, latest start first"""
+        ends = self._ends[kind]
+        max_ends = self._max_ends[kind]
+        i = bisect_right(self._starts[kind], now) - 1
+        # usually stops after the first step, unless it is nested in longer ones
+        while i >= 0 and max_ends[i] > now:
+            if ends[i] > now:
+                yield i
+            i -= 1
+
+    def current(self, kind: str, now: int) -> Optional[Step]:
+        """Return the step of the given kind airing at now, the innermost one if nested"""
+        for i in self._airing(kind, now):
+            return self._steps[kind][i]
+        return None
+
+    def next_transition(self, now: int, kind: Optional[str] = None) -> Optional[int]:
+        """Return the first time after now when a step (of the given kind) starts or ends"""
+        transitions = []
+        for k in STEP_KINDS if kind is None else (kind,):
+            starts = self._starts[k]
+            i = bisect_right(starts, now)
+            if i < len(starts):
+                transitions.append(starts[i])
+            transitions.extend(self._ends[k][j] for j in self._airing(k, now))
+        return min(transitions, default=None)
+
+    def last_ends(self) -> dict[str, int]:
+        """Return the end of the last step of each kind present in the grid"""
+        return {kind: max(ends) for kind, ends in self._ends.items() if len(ends) > 0}
+
+    def frontier(self, since: int = 0) -> int:
+        """Return the timestamp up to which the grid is known for every kind of step
+
+        Kinds are considered separately because a long diffusion can end far after the
+        last published track. Kinds whose last step ended before since are ignored
+        (e.g. a few tracks played hours ago during a talk show).
+        """
+        last_ends = list(self.last_ends().values())
+        recent_ends = [end for end in last_ends if end >= since]
+        return min(recent_ends or last_ends, default=0)
+
+    def merge(
+        self,
+        new_steps: list[Step],
+        start_ts: int,
+        end_ts: int,
+        evict_before: int,
+        kinds: tuple[str, ...] = STEP_KINDS,
+    ) -> "Timeline":
+        """Return a timeline with the steps fetched between start_ts and end_ts merged into this one
+
+        Steps are matched by id, new versions replacing old ones. Known steps of the
+        fetched kinds starting in [start_ts, end_ts) which were not fetched again were
+        removed from the grid and are dropped, as are steps which ended before
+        evict_before.
+        """
+        fetched_ids = {p.id for p in new_steps}
+        steps_by_id = {
+            p.id: p
+            for p in self.steps
+            if p.id in fetched_ids
+            or p.kind not in kinds
+            or not start_ts <= p.start < end_ts
+        }
+        for p in new_steps:
+            known = steps_by_id.get(p.id)
+            # keep the known instance when unchanged so that consumers can compare by identity
+            if known is None or known != p:
+                steps_by_id[p.id] = p
+        return Timeline([p for p in steps_by_id.values() if p.end >= evict_before])
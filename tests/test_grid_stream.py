@@ -0,0 +1,124 @@
+import json
+import random
+
+import pytest
+
+from custom_components.radio_france.grid_stream import GridStreamParser
+
+
+def _response(rnd: random.Random) -> dict:
+    data = {}
+    for i in range(rnd.randint(1, 4)):
+        if rnd.random() < 0.2:
+            data[f"station_{i}"] = None
+            continue
+        data[f"station_{i}"] = [
+            {
+                "id": f"step-{i}-{j}",
+                "start": rnd.randint(0, 10**10),
+                "end": rnd.randint(0, 10**10),
+                "title": rnd.choice([None, "Émission", '«Jazz» \\ "live"', "🎷"]),
+                "track": rnd.choice(
+                    [None, {}, {"mainArtists": ["Édith Piaf", "Ø"], "ratio": 0.5}]
+                ),
+                "flag": rnd.choice([True, False]),
+            }
+            for j in range(rnd.randint(0, 6))
+        ]
+    response = {"data": data}
+    if rnd.random() < 0.3:
+        response["errors"] = [{"message": "Station inconnue", "path": ["station_0"]}]
+        # errors may come first
+        response = dict(reversed(list(response.items())))
+    return response
+
+
+def _parse(chunks) -> tuple[dict, GridStreamParser]:
+    parser = GridStreamParser()
+    grids: dict = {}
+    for chunk in chunks:
+        for event, alias, entry in parser.feed(chunk):
+            if event == "step":
+                grids.setdefault(alias, []).append(entry)
+            else:
+                grids[alias] = ("complete", grids.get(alias, []))
+    parser.close()
+    return grids, parser
+
+
+def _check(response: dict, grids: dict, parser: GridStreamParser) -> None:
+    expected = {a: g for a, g in response["data"].items() if g is not None}
+    assert {a: g[1] for a, g in grids.items()} == expected
+    assert all(g[0] == "complete" for g in grids.values())
+    assert parser.null_grids == {a for a, g in response["data"].items() if g is None}
+    assert parser.extra.get("errors") == response.get("errors")
+
+
+def _random_chunks(raw: bytes, rnd: random.Random) -> list[bytes]:
+    chunks = []
+    pos = 0
+    while pos < len(raw):
+        size = rnd.choice([1, 2, 3, 7, 64, 1024])
+        chunks.append(raw[pos : pos + size])
+        pos += size
+    return chunks
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_random_chunks(seed):
+    rnd = random.Random(seed)
+    response = _response(rnd)
+    raw = json.dumps(
+        response, ensure_ascii=False, indent=rnd.choice([None, 2])
+    ).encode()
+    grids, parser = _parse(_random_chunks(raw, rnd))
+    _check(response, grids, parser)
+
+
+def test_every_split_point():
+    response = {
+        "errors": [{"message": "é"}],
+        "data": {
+            "station_0": [{"id": "a", "start": 1, "end": 2, "ok": True}, {}],
+            "station_1": None,
+            "station_2": [],
+        },
+    }
+    raw = json.dumps(response, ensure_ascii=False).encode()
+    for i in range(len(raw) + 1):
+        grids, parser = _parse([raw[:i], raw[i:]])
+        _check(response, grids, parser)
+
+
+def test_steps_are_yielded_before_the_response_is_complete():
+    parser = GridStreamParser()
+    events = list(parser.feed(b'{"data": {"station_0": [{"id": "a"}, {"id": "b"'))
+    assert events == [("step", "station_0", {"id": "a"})]
+
+
+def test_null_data():
+    grids, parser = _parse([b'{"errors": [{"message": "x"}], "data": null}'])
+    assert grids == {}
+    assert parser.extra == {"errors": [{"message": "x"}], "data": None}
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b'{"data": {"station_0": [{"id": "a"}',
+        b'{"data": {"station_0": [{"id": "a"}]}',
+        b'{"data": {"station_0": [',
+        b"",
+    ],
+)
+def test_truncated_response(raw):
+    parser = GridStreamParser()
+    list(parser.feed(raw))
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_unexpected_grid():
+    parser = GridStreamParser()
+    with pytest.raises(ValueError):
+        list(parser.feed(b'{"data": {"station_0": 12}}'))
@@ -0,0 +1,65 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.radio_france.interval_index import IntervalIndex
+
+
+def _index() -> IntervalIndex:
+    return IntervalIndex(lambda i: i[0], lambda i: i[1])
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_updates(seed):
+    rnd = random.Random(seed)
+    index = _index()
+    items = {}
+    for _ in range(500):
+        key = rnd.randint(0, 60)
+        if rnd.random() < 0.6:
+            start = rnd.randint(0, 1000)
+            item = (start, start + rnd.choice([0, 1, 10, rnd.randint(0, 500)]))
+            index.add(key, item)
+            items[key] = item
+        else:
+            index.remove(key)
+            items.pop(key, None)
+        lo = rnd.randint(-10, 1600)
+        hi = lo + rnd.choice([0, rnd.randint(0, 300)])
+        found = index.overlapping(lo, hi)
+        assert sorted(found) == sorted(
+            i for i in items.values() if i[0] <= hi and i[1] >= lo
+        )
+        assert [i[0] for i in found] == sorted(i[0] for i in found)
+        assert len(index) == len(items)
+
+
+def test_same_start():
+    index = _index()
+    for key in range(5):
+        index.add(key, (10, 10 + key))
+    index.remove(2)
+    index.add(3, (10, 11))
+    assert sorted(index.overlapping(12, 12)) == [(10, 14)]
+    assert len(index.overlapping(10, 10)) == 4
+
+
+def test_closed_intervals():
+    index = _index()
+    index.add("a", (0, 10))
+    assert index.overlapping(10, 20) == [(0, 10)]
+    assert index.overlapping(-5, 0) == [(0, 10)]
+    assert index.overlapping(11, 20) == []
+    assert _index().overlapping(0, 10) == []
+
+
+def test_datetimes():
+    now = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    index = IntervalIndex(lambda i: i[0], lambda i: i[1])
+    index.add("long", (now, now + timedelta(hours=3)))
+    index.add("track", (now + timedelta(hours=1), now + timedelta(minutes=63)))
+    moment = now + timedelta(minutes=62)
+    assert len(index.overlapping(moment, moment)) == 2
+    index.remove("long")
+    assert index.overlapping(now + timedelta(hours=2), now + timedelta(hours=2)) == []
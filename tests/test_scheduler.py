@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import pytest
+
+from custom_components.radio_france.scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_LIVE,
+    PRIORITY_USER,
+    RequestScheduler,
+)
+
+
+def test_burst_then_rate():
+    async def run():
+        scheduler = RequestScheduler(rate=20, capacity=3)
+        started = time.monotonic()
+        for _ in range(5):
+            await scheduler.acquire(PRIORITY_BACKGROUND)
+        return time.monotonic() - started, scheduler
+
+    elapsed, scheduler = asyncio.run(run())
+    # 3 tokens right away, then 2 at 20 per second
+    assert 0.08 <= elapsed < 0.5
+    assert scheduler.served == 5
+
+
+def test_priorities():
+    async def run():
+        scheduler = RequestScheduler(rate=50, capacity=1)
+        await scheduler.acquire(PRIORITY_USER)
+        served = []
+
+        async def request(priority, name):
+            await scheduler.acquire(priority)
+            served.append(name)
+
+        await asyncio.gather(
+            request(PRIORITY_BACKGROUND, "background"),
+            request(PRIORITY_LIVE, "live"),
+            request(PRIORITY_USER, "user"),
+            request(PRIORITY_BACKGROUND, "background 2"),
+        )
+        return served
+
+    assert asyncio.run(run()) == ["user", "live", "background", "background 2"]
+
+
+def test_timeout():
+    async def run():
+        scheduler = RequestScheduler(rate=1, capacity=1)
+        await scheduler.acquire(PRIORITY_BACKGROUND)
+        with pytest.raises(asyncio.TimeoutError):
+            await scheduler.acquire(PRIORITY_BACKGROUND, max_wait=0.05)
+        assert scheduler.rejected == 1
+        # the timed out request does not hold the next token
+        assert scheduler.queue_depth == 0
+
+    asyncio.run(run())
+
+
+def test_penalize():
+    async def run():
+        scheduler = RequestScheduler(rate=1000, capacity=10)
+        scheduler.penalize(0.1)
+        started = time.monotonic()
+        await scheduler.acquire(PRIORITY_USER)
+        return time.monotonic() - started
+
+    assert asyncio.run(run()) >= 0.09
+
+
+def test_try_acquire():
+    async def run():
+        scheduler = RequestScheduler(rate=10, capacity=2)
+        assert [scheduler.try_acquire() for _ in range(3)] == [True, True, False]
+        assert 0 < scheduler.next_token_in() <= 0.1
+        await asyncio.sleep(scheduler.next_token_in() + 0.01)
+        assert scheduler.try_acquire()
+        assert (scheduler.served, scheduler.rejected) == (3, 1)
+
+    asyncio.run(run())
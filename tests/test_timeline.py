@@ -0,0 +1,148 @@
+import random
+
+import pytest
+
+from custom_components.radio_france.steps import STEP_KINDS, parse_step
+from custom_components.radio_france.timeline import Timeline
+
+
+def _step(rnd: random.Random, step_id: str, start: int, end: int):
+    kind = rnd.choice(STEP_KINDS)
+    title = rnd.choice(["a", "b"])
+    if kind == "track":
+        return parse_step(
+            {"id": step_id, "start": start, "end": end, "track": {"title": title}}
+        )
+    if kind == "diffusion":
+        return parse_step(
+            {"id": step_id, "start": start, "end": end, "diffusion": {"title": title}}
+        )
+    return parse_step({"id": step_id, "start": start, "end": end, "title": title})
+
+
+def _random_steps(rnd: random.Random, count: int, prefix: str = "s") -> list:
+    steps = []
+    for i in range(count):
+        start = rnd.randint(0, 1000)
+        # mostly short steps, some long ones with others nested in them
+        length = rnd.choice([0, 1, 5, 10, 30, rnd.randint(50, 600)])
+        steps.append(_step(rnd, f"{prefix}{i}", start, start + length))
+    return steps
+
+
+def _airing(steps, kind, now):
+    return [
+        p
+        for p in sorted(steps, key=lambda p: p.start)
+        if p.kind == kind and p.start <= now < p.end
+    ]
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_current_and_next_transition(seed):
+    rnd = random.Random(seed)
+    steps = _random_steps(rnd, rnd.randint(0, 60))
+    timeline = Timeline(steps)
+    for now in range(-5, 1700, 7):
+        transitions = []
+        for kind in STEP_KINDS:
+            airing = _airing(steps, kind, now)
+            current = timeline.current(kind, now)
+            # the innermost step, i.e. the last one to start
+            assert current is (airing[-1] if airing else None)
+            expected = [p.start for p in steps if p.kind == kind and p.start > now]
+            expected += [p.end for p in airing]
+            assert timeline.next_transition(now, kind) == min(expected, default=None)
+            transitions += expected
+        assert timeline.next_transition(now) == min(transitions, default=None)
+
+
+def _diffusion(step_id: str, start: int, end: int):
+    return parse_step(
+        {"id": step_id, "start": start, "end": end, "diffusion": {"title": step_id}}
+    )
+
+
+def test_current_nested_step():
+    timeline = Timeline(
+        [
+            _diffusion("long", 0, 100),
+            _diffusion("short", 10, 20),
+            _diffusion("after", 60, 70),
+        ]
+    )
+    assert timeline.current("diffusion", 15).id == "short"
+    assert timeline.current("diffusion", 50).id == "long"
+    assert timeline.next_transition(50) == 60
+    assert timeline.next_transition(80) == 100
+    assert timeline.current("diffusion", 100) is None
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_merge(seed):
+    rnd = random.Random(seed)
+    known = _random_steps(rnd, 40)
+    timeline = Timeline(known)
+    start_ts = rnd.randint(0, 800)
+    end_ts = start_ts + rnd.randint(0, 400)
+    evict_before = rnd.randint(0, 300)
+    kinds = rnd.choice([STEP_KINDS, ("track",)])
+    # some known steps are fetched again (changed or not), others are new
+    fetched = [
+        p if rnd.random() < 0.5 else _step(rnd, p.id, p.start, p.end)
+        for p in known
+        if start_ts <= p.start < end_ts and p.kind in kinds and rnd.random() < 0.7
+    ]
+    fetched += [
+        p
+        for p in _random_steps(rnd, 5, prefix="new")
+        if start_ts <= p.start < end_ts and p.kind in kinds
+    ]
+
+    merged = timeline.merge(fetched, start_ts, end_ts, evict_before, kinds=kinds)
+
+    fetched_by_id = {p.id: p for p in fetched}
+    expected = {}
+    for p in known:
+        vanished = p.kind in kinds and start_ts <= p.start < end_ts
+        if p.id not in fetched_by_id and not vanished:
+            expected[p.id] = p
+    expected.update(fetched_by_id)
+    expected = {i: p for i, p in expected.items() if p.end >= evict_before}
+    assert {p.id: p for p in merged} == expected
+    for p in merged:
+        # unchanged steps keep their instance
+        known_step = next((k for k in known if k.id == p.id), None)
+        if known_step is not None and known_step == p:
+            assert p is known_step
+    assert [p.start for p in merged] == sorted(p.start for p in merged)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_diff(seed):
+    rnd = random.Random(seed)
+    previous = Timeline(_random_steps(rnd, 30))
+    steps = [
+        p if rnd.random() < 0.7 else _step(rnd, p.id, p.start, p.end)
+        for p in previous
+        if rnd.random() < 0.8
+    ] + _random_steps(rnd, 5, prefix="new")
+    timeline = Timeline(steps)
+    delta = timeline.diff(previous)
+    previous_by_id = {p.id: p for p in previous}
+    assert delta.added == {p.id for p in steps if p.id not in previous_by_id}
+    assert delta.removed == previous_by_id.keys() - {p.id for p in steps}
+    assert delta.changed == {
+        p.id for p in steps if p.id in previous_by_id and previous_by_id[p.id] != p
+    }
+    assert bool(delta) == (timeline != previous)
+    assert Timeline(list(previous)) == previous
+    assert not Timeline(list(previous)).diff(previous)
+
+
+def test_frontier_ignores_stale_kinds():
+    track = parse_step({"id": "t", "start": 0, "end": 10, "track": {"title": "a"}})
+    timeline = Timeline([track, _diffusion("d", 0, 100)])
+    assert timeline.frontier() == 10
+    assert timeline.frontier(since=50) == 100
+    assert Timeline([]).frontier() == 0
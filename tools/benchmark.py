@@ -0,0 +1,210 @@
+"""End-to-end benchmark of the integration against the local stand-in server
+
+Runs the real RadioFranceApi, coordinators, sensors and calendar against
+fake_radiofrance_server and reports, for each refresh round: requests sent, bytes
+transferred, refresh latency, then cpu time per entity update and memory per station.
+The first round refreshes all stations at once, as at startup. Following rounds run
+refreshes as they would be scheduled after the previous one (see
+refresh_as_scheduled), which shows how much batching happens in steady state.
+
+Usage (homeassistant and the integration requirements must be installed):
+    python tools/benchmark.py --stations 15 --rounds 5 --latency 0.1
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TOOLS_DIR))
+sys.path.insert(0, TOOLS_DIR)
+
+from fake_radiofrance_server import FakeServer, station_codes  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--stations", type=int, default=15)
+    parser.add_argument("--music-ratio", type=float, default=0.2)
+    parser.add_argument("--track-length", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0, help="in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rounds", type=int, default=5, help="refresh rounds")
+    parser.add_argument(
+        "--updates", type=int, default=200, help="entity updates timed per entity"
+    )
+    parser.add_argument("--json", action="store_true", help="print report as json")
+    return parser.parse_args()
+
+
+def cpu_time_per_call(func, count: int) -> float:
+    start = time.process_time()
+    for _ in range(count):
+        func()
+    return (time.process_time() - start) / count
+
+
+async def refresh_as_scheduled(coordinators: list, batch_window: float) -> None:
+    """Run the next refresh of each coordinator as Home Assistant would schedule it
+
+    HA schedules a refresh on the whole second of the loop time, plus a fraction of a
+    second of its own to the coordinator, plus its update interval. Refreshes whose
+    deadlines fall within the batch window of the first one of a group are run
+    together, with their actual offsets, and groups one after the other: waiting
+    for the actual intervals (minutes to hours) is skipped.
+    """
+    now = int(asyncio.get_running_loop().time())
+    deadlines = sorted(
+        (
+            now + getattr(c, "_microsecond", 0) + c.update_interval.total_seconds(),
+            i,
+        )
+        for i, c in enumerate(coordinators)
+    )
+    groups = []
+    for deadline, i in deadlines:
+        if len(groups) == 0 or deadline - groups[-1][0][0] > batch_window:
+            groups.append([])
+        groups[-1].append((deadline, coordinators[i]))
+
+    async def refresh_at(delay: float, coordinator) -> None:
+        await asyncio.sleep(delay)
+        await coordinator.async_refresh()
+
+    for group in groups:
+        first = group[0][0]
+        await asyncio.gather(*(refresh_at(d - first, c) for d, c in group))
+
+
+async def run(args: argparse.Namespace) -> dict:
+    stations = station_codes(args.stations, args.music_ratio)
+    server = FakeServer(
+        stations,
+        track_length=args.track_length,
+        latency=args.latency,
+        error_rate=args.error_rate,
+    )
+    runner = await server.start(port=args.port)
+    # must be set before the integration is imported
+    os.environ["RADIOFRANCE_API_URL"] = f"http://localhost:{args.port}/v1/graphql"
+
+    from homeassistant.core import HomeAssistant
+    from custom_components.radio_france import (
+        RadioFranceAPICoordinator,
+        AiringNowProgramEntity,
+        AiringNowTrackEntity,
+        AiringCalendar,
+    )
+    from custom_components.radio_france.api import RadioFranceApi, GRID_BATCH_WINDOW
+    from custom_components.radio_france.const import CONF_API_KEY, CONF_RADIO_STATION
+
+    report = {"stations": len(stations), "rounds": []}
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        api = RadioFranceApi("benchmark")
+        coordinators = []
+        entities = []
+        for i, station in enumerate(stations):
+            entry = SimpleNamespace(
+                entry_id=f"benchmark{i}",
+                data={CONF_API_KEY: "benchmark", CONF_RADIO_STATION: station},
+                options={},
+            )
+            coordinator = RadioFranceAPICoordinator(hass, dict(entry.data), api)
+            coordinators.append(coordinator)
+            for entity_class in (
+                AiringNowProgramEntity,
+                AiringNowTrackEntity,
+                AiringCalendar,
+            ):
+                entity = entity_class(coordinator, hass, entry)
+                entity.entity_id = f"{entity_class.__name__.lower()}.benchmark_{i}"
+                entities.append(entity)
+
+        tracemalloc.start()
+        for round_number in range(args.rounds):
+            server.reset_stats()
+            memory_before = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            if round_number == 0:
+                await asyncio.gather(*(c.async_refresh() for c in coordinators))
+            else:
+                await refresh_as_scheduled(coordinators, GRID_BATCH_WINDOW)
+            latency = time.perf_counter() - start
+            retained = tracemalloc.get_traced_memory()[0] - memory_before
+            report["rounds"].append(
+                {
+                    "round": round_number,
+                    "mode": "startup" if round_number == 0 else "steady",
+                    "refresh_latency_s": round(latency, 4),
+                    "requests": server.stats["requests"],
+                    "requests_per_station_refresh": round(
+                        server.stats["requests"] / len(stations), 3
+                    ),
+                    "bytes": server.stats["bytes_sent"],
+                    "errors": server.stats["errors"],
+                    "failed_refreshes": sum(
+                        not c.last_update_success for c in coordinators
+                    ),
+                    "retained_memory_per_station": retained // len(stations),
+                }
+            )
+        tracemalloc.stop()
+
+        updates = {}
+        for entity in entities:
+            if entity.coordinator.data is None:
+                continue
+            if isinstance(entity, AiringCalendar):
+                func = entity._handle_coordinator_update
+            else:
+                func = entity._refresh_state
+            name = type(entity).__name__
+            updates.setdefault(name, []).append(cpu_time_per_call(func, args.updates))
+            if not isinstance(entity, AiringCalendar):
+                entity._cancel_transition()
+        report["cpu_per_update_us"] = {
+            name: round(sum(times) / len(times) * 1e6, 1)
+            for name, times in updates.items()
+        }
+        report["steps_per_station"] = round(
+            sum(len(c.data) for c in coordinators if c.data is not None)
+            / len(stations),
+            1,
+        )
+
+        await api.close()
+        await hass.async_stop(force=True)
+    await runner.cleanup()
+    return report
+
+
+def print_report(report: dict) -> None:
+    print(f"{report['stations']} stations, {report['steps_per_station']} steps each")
+    columns = list(report["rounds"][0].keys())
+    print("  ".join(columns))
+    for r in report["rounds"]:
+        print("  ".join(str(r[c]).rjust(len(c)) for c in columns))
+    print("cpu time per update (µs):")
+    for name, value in report["cpu_per_update_us"].items():
+        print(f"  {name}: {value}")
+
+
+def main() -> None:
+    args = parse_args()
+    report = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""Local stand-in for the Radio France GraphQL api
+
+Serves generated grids for a configurable number of stations, with configurable
+latency and error rate, and counts requests and bytes sent (GET /stats).
+Queries are executed by graphql-core against a schema mimicking the real one, so
+schema introspection done by gql works as with the real api.
+
+Usage:
+    python tools/fake_radiofrance_server.py --stations 15 --latency 0.2 --error-rate 0.05
+
+Then point the integration to it:
+    RADIOFRANCE_API_URL=http://localhost:8765/v1/graphql
+"""
+
+import argparse
+import json
+import random
+import time
+import asyncio
+from typing import Optional
+
+from aiohttp import web
+from graphql import build_schema, graphql
+
+SCHEMA_SDL = """
+enum StationsEnum {
+  %(stations)s
+}
+
+type Diffusion {
+  id: ID!
+  title: String
+  standFirst: String
+  published_date: String
+  url: String
+}
+
+type Track {
+  id: ID!
+  title: String
+  authors: [String]
+  mainArtists: [String]
+  albumTitle: String
+}
+
+type DiffusionStep {
+  id: ID!
+  start: Int!
+  end: Int!
+  diffusion: Diffusion
+}
+
+type TrackStep {
+  id: ID!
+  start: Int!
+  end: Int!
+  track: Track
+}
+
+type BlankStep {
+  id: ID!
+  title: String
+  start: Int!
+  end: Int!
+}
+
+union Step = DiffusionStep | TrackStep | BlankStep
+
+type Station {
+  id: StationsEnum!
+  title: String
+  description: String
+  liveStream: String
+  playerUrl: String
+}
+
+type Brand {
+  id: String!
+  title: String
+  baseline: String
+  description: String
+  websiteUrl: String
+  playerUrl: String
+  liveStream: String
+  localRadios: [Station]
+  webRadios: [Station]
+}
+
+type Query {
+  grid(start: Int!, end: Int!, station: StationsEnum!, includeTracks: Boolean): [Step]
+  brands: [Brand]
+}
+"""
+
+
+def station_codes(count: int, music_ratio: float) -> list:
+    """Return station codes, music-only stations being named like FIP ones"""
+    music_count = round(count * music_ratio)
+    return [f"FIP_{i}" for i in range(music_count)] + [
+        f"STATION_{i}" for i in range(count - music_count)
+    ]
+
+
+class FakeGrid:
+    """Deterministic program generator
+
+    Talk stations air one diffusion per hour (with a blank every 5 hours), published
+    well in advance. Music stations air tracks of track_length seconds inside 3-hour
+    diffusions, and tracks are only published once they started, like FIP does.
+    """
+
+    def __init__(self, track_length: int):
+        self.track_length = track_length
+
+    def grid(self, station: str, start: int, end: int, include_tracks: bool) -> list:
+        now = int(time.time())
+        if station.startswith("FIP"):
+            steps = self._slots(station, start, end, 3 * 3600, "diffusion")
+            if include_tracks:
+                steps += [
+                    s
+                    for s in self._slots(
+                        station, start, end, self.track_length, "track"
+                    )
+                    if s["start"] <= now
+                ]
+            return steps
+        return self._slots(station, start, end, 3600, "diffusion")
+
+    def _slots(self, station: str, start: int, end: int, length: int, kind: str):
+        steps = []
+        slot_start = start - start % length
+        while slot_start < end:
+            steps.append(self._step(station, slot_start, slot_start + length, kind))
+            slot_start += length
+        return steps
+
+    def _step(self, station: str, start: int, end: int, kind: str) -> dict:
+        step_id = f"{station}-{kind}-{start}"
+        if kind == "track":
+            artist = f"Artist {start // self.track_length % 97}"
+            return {
+                "__typename": "TrackStep",
+                "id": step_id,
+                "start": start,
+                "end": end,
+                "track": {
+                    "id": f"{step_id}-track",
+                    "title": f"Track {start}",
+                    "authors": [artist],
+                    "mainArtists": [artist],
+                    "albumTitle": f"Album {start // self.track_length % 53}",
+                },
+            }
+        if start // 3600 % 5 == 0 and not station.startswith("FIP"):
+            return {
+                "__typename": "BlankStep",
+                "id": step_id,
+                "title": "Programmation musicale",
+                "start": start,
+                "end": end,
+            }
+        return {
+            "__typename": "DiffusionStep",
+            "id": step_id,
+            "start": start,
+            "end": end,
+            "diffusion": {
+                "id": f"{step_id}-diffusion",
+                "title": f"Show of {station} at {start}",
+                "standFirst": "Lorem ipsum dolor sit amet. " * 8,
+                "published_date": str(start),
+                "url": f"https://example.org/{station}/{start}",
+            },
+        }
+
+
+class Root:
+    def __init__(self, stations: list, fake_grid: FakeGrid):
+        self._stations = stations
+        self._fake_grid = fake_grid
+
+    def grid(self, info, start, end, station, includeTracks=False):
+        return self._fake_grid.grid(station, start, end, includeTracks)
+
+    def brands(self, info):
+        return [
+            {
+                "id": "FAKE",
+                "title": "Fake brand",
+                "localRadios": [{"id": s, "title": s.title()} for s in self._stations],
+                "webRadios": None,
+            }
+        ]
+
+
+class FakeServer:
+    def __init__(
+        self,
+        stations: list,
+        track_length: int = 200,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limited_rate: float = 0.0,
+    ):
+        self.schema = build_schema(SCHEMA_SDL % {"stations": "\n  ".join(stations)})
+        self.root = Root(stations, FakeGrid(track_length))
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limited_rate = rate_limited_rate
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.stats = {
+            "requests": 0,
+            "introspections": 0,
+            "grid_fields": 0,
+            "errors": 0,
+            "bytes_sent": 0,
+        }
+
+    async def handle_graphql(self, request: web.Request) -> web.Response:
+        self.stats["requests"] += 1
+        body = await request.json()
+        query = body.get("query", "")
+        if "__schema" in query:
+            self.stats["introspections"] += 1
+        self.stats["grid_fields"] += query.count("grid(")
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        draw = random.random()
+        if draw < self.rate_limited_rate:
+            self.stats["errors"] += 1
+            return web.Response(status=429, headers={"Retry-After": "5"})
+        if draw < self.rate_limited_rate + self.error_rate:
+            self.stats["errors"] += 1
+            return web.Response(status=500, text="fake failure")
+
+        result = await graphql(
+            self.schema,
+            query,
+            root_value=self.root,
+            variable_values=body.get("variables"),
+            operation_name=body.get("operationName"),
+        )
+        payload = json.dumps(result.formatted).encode()
+        self.stats["bytes_sent"] += len(payload)
+        return web.Response(body=payload, content_type="application/json")
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats)
+
+    async def handle_reset(self, request: web.Request) -> web.Response:
+        self.reset_stats()
+        return web.json_response(self.stats)
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/v1/graphql", self.handle_graphql)
+        app.router.add_get("/stats", self.handle_stats)
+        app.router.add_post("/stats/reset", self.handle_reset)
+        return app
+
+    async def start(self, host: str = "localhost", port: int = 8765) -> web.AppRunner:
+        runner = web.AppRunner(self.app())
+        await runner.setup()
+        await web.TCPSite(runner, host, port).start()
+        return runner
+
+
+def parse_args(args: Optional[list] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--stations", type=int, default=15)
+    parser.add_argument(
+        "--music-ratio",
+        type=float,
+        default=0.2,
+        help="share of music-only stations (publishing tracks, FIP-like)",
+    )
+    parser.add_argument(
+        "--track-length",
+        type=int,
+        default=200,
+        help="track duration in seconds, lower values mean bigger grids",
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limited-rate", type=float, default=0.0)
+    return parser.parse_args(args)
+
+
+def main() -> None:
+    args = parse_args()
+    server = FakeServer(
+        station_codes(args.stations, args.music_ratio),
+        track_length=args.track_length,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limited_rate=args.rate_limited_rate,
+    )
+    web.run_app(server.app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Measure the time taken to import the integration, on top of Home Assistant
+
+Home Assistant modules used by the integration are imported first, as they are
+already loaded when HA sets the integration up. The report lists the modules
+imported because of the integration, slowest first, and exits with an error if
+their total exceeds the budget.
+
+Usage (homeassistant must be installed):
+    python tools/import_time.py --budget-ms 30
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(TOOLS_DIR)
+
+# already imported by Home Assistant before it loads the integration
+PRELOADED = [
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.event",
+    "homeassistant.components.sensor",
+    "homeassistant.components.calendar",
+    "aiohttp",
+]
+INTEGRATION = "custom_components.radio_france"
+DEFAULT_BUDGET_MS = 30
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help="fail if importing the integration takes longer",
+    )
+    parser.add_argument("--top", type=int, default=10, help="modules to list")
+    return parser.parse_args()
+
+
+def measure() -> list[tuple[str, int, int]]:
+    """Return (module, self µs, cumulative µs) of modules imported by the integration"""
+    code = f"import {', '.join(PRELOADED)}; import {INTEGRATION}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    lines = [l for l in result.stderr.splitlines() if l.startswith("import time:")]
+    modules = []
+    for line in lines[1:]:  # first line is the header
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        modules.append((name.rstrip(), int(self_us), int(cumulative_us)))
+    # modules are listed once imported: everything after the last preloaded one is ours
+    preloaded_end = max(
+        i for i, (name, _, _) in enumerate(modules) if name.strip() in PRELOADED
+    )
+    return modules[preloaded_end + 1 :]
+
+
+def main() -> None:
+    args = parse_args()
+    modules = measure()
+    total_ms = sum(self_us for _, self_us, _ in modules) / 1000
+    print(f"{INTEGRATION}: {total_ms:.1f}ms (budget {args.budget_ms:.1f}ms)")
+    for name, self_us, _ in sorted(modules, key=lambda m: -m[1])[: args.top]:
+        print(f"  {self_us / 1000:7.1f}ms  {name.strip()}")
+    if total_ms > args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()